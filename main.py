@@ -2,8 +2,19 @@ import pgzero
 import pgzrun
 from pgzero.actor import Actor
 from pgzero.rect import Rect
+from pgzero import ptext
 import math
+import os
+import pickle
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 import pygame
+import numpy as np
+try:
+    from scipy import ndimage
+except ImportError:
+    # Optional: only used to speed up connected-component cropping of sprites
+    ndimage = None
 
 # Game configuration
 WIDTH = 1550
@@ -23,13 +34,21 @@ FIREBALL_HITBOX_OFFSET_X = -77  # horizontal offset applied to fireball collisio
 FIREBALL_HITBOX_OFFSET_Y = -4   # vertical offset applied to fireball collision mask and debug outline
 MARIO_BOX_OFFSET_X = -91  # calibration: negative moves boxes left
 MARIO_BOX_OFFSET_Y = -10  # calibration: negative moves boxes up
+MARIO_BLOCK_BOX_DX = (-40, 80)  # hurtbox nudge while blocking, indexed by facing_right
 HAMMER_ACTIVE_START_RATIO = 0.5  # hammer becomes active in the later half of the swing
 HAMMER_YELLOW_COLOR = (255, 255, 0, 255)
 HAMMER_YELLOW_TOLERANCE = (80, 80, 80, 255)
 HAMMER_HITBOX_OFFSET_X = -60  # calibration for hammer mask alignment (negative = left)
 HAMMER_HITBOX_OFFSET_Y = -10  # calibration for hammer mask alignment (negative = up)
-
-# Debug hitbox visualization (toggle by holding the '1' key)
+MASK_CACHE_SIZE = 16  # silhouette masks kept per fighter (oldest evicted first)
+FIREBALL_SHEET = "images/mario_fireball.png"  # shared by every Fireball (see Fireball._frame_cache)
+# Mario animation states (index into Mario._anim_handlers)
+ANIM_STAND, ANIM_ATTACK, ANIM_SPECIAL, ANIM_HIT, ANIM_BLOCK = range(5)
+# Bowser animation states (index into Bowser._anim_handlers)
+(BOWSER_ANIM_STAND, BOWSER_ANIM_PUNCH, BOWSER_ANIM_FLAME_RESET, BOWSER_ANIM_FLAMEBLAST,
+ BOWSER_ANIM_CHARGE, BOWSER_ANIM_HIT, BOWSER_ANIM_BLOCK) = range(7)
+
+# Debug hitbox visualization and [DEBUG] hit logging (toggle by holding the '1' key)
 DEBUG_SHOW_BOXES = False
 _DEBUG_HOLD_TICKS = 180  # ~3 seconds at 60 FPS
 _debug_ticks = 0
@@ -38,6 +57,12 @@ DEBUG_STOPTIME = False  # Debug-only stop-time toggle (freeze updates)
 _stop_toggle_consumed = False
 # Debug clock start ticks (set on first update once playing starts)
 GAME_START_TICKS = None
+# Debug clock text, rebuilt only when the shown tenth of a second changes
+_clock_tenths = -1
+_clock_str = ""
+# Health bar backgrounds (static HUD chrome; only the fill width changes per frame)
+MARIO_HP_BAR = Rect(50, 50, 160, 16)
+BOWSER_HP_BAR = Rect(WIDTH - 210, 50, 160, 16)
 
 # Game state
 game_state = "menu"  # menu, playing, paused
@@ -55,15 +80,264 @@ def _prepare_background():
     global _background_surface, _background_pos
     if _background_surface is not None:
         return
-    # Load original image
-    original = pygame.image.load("images/peachs_castle.png").convert()
-    img_w, img_h = original.get_width(), original.get_height()
-    # Scale proportionally to cover the screen (cover), cropping if necessary
-    scale = max(WIDTH / img_w, HEIGHT / img_h)
-    new_size = (max(1, int(img_w * scale)), max(1, int(img_h * scale)))
-    _background_surface = pygame.transform.smoothscale(original, new_size)
-    # Center the image with possible letterboxing
-    _background_pos = ((WIDTH - new_size[0]) // 2, (HEIGHT - new_size[1]) // 2)
+    source_path = "images/peachs_castle.png"
+    # Pre-scaled copy for this screen size; BMP loads without any decode work
+    cache_path = os.path.join(SPRITE_CACHE_DIR, f"bg_{WIDTH}x{HEIGHT}.bmp")
+    try:
+        if os.path.getmtime(cache_path) >= os.path.getmtime(source_path):
+            _background_surface = pygame.image.load(cache_path).convert()
+    except (OSError, pygame.error):
+        _background_surface = None
+    if _background_surface is None:
+        # Load original image
+        original = pygame.image.load(source_path).convert()
+        img_w, img_h = original.get_width(), original.get_height()
+        # Scale proportionally to cover the screen (cover), cropping if necessary
+        scale = max(WIDTH / img_w, HEIGHT / img_h)
+        new_size = (max(1, int(img_w * scale)), max(1, int(img_h * scale)))
+        scaled = pygame.transform.smoothscale(original, new_size)
+        # Crop to exactly the screen, in the display format (no per-pixel alpha),
+        # so the per-frame blit is a plain unclipped copy
+        _background_surface = pygame.Surface((WIDTH, HEIGHT)).convert()
+        _background_surface.blit(scaled, ((WIDTH - new_size[0]) // 2, (HEIGHT - new_size[1]) // 2))
+        try:
+            _write_cache_file(cache_path, ".bmp", lambda tmp_path: pygame.image.save(_background_surface, tmp_path))
+        except (OSError, pygame.error):
+            pass
+    # Center the image (older caches hold the uncropped scale)
+    new_w, new_h = _background_surface.get_size()
+    _background_pos = ((WIDTH - new_w) // 2, (HEIGHT - new_h) // 2)
+
+# --- Sprite sheet slicing helpers (vectorized with NumPy) ---
+def _non_background_mask(sheet, bg):
+    """Return a (W, H) boolean array marking pixels whose colour differs from bg."""
+    if sheet.get_bytesize() == 4:
+        # One uint32 compare per pixel against the packed background (RGB bits only)
+        r_mask, g_mask, b_mask, _ = sheet.get_masks()
+        rgb_bits = np.uint32(r_mask | g_mask | b_mask)
+        packed_bg = np.uint32(sheet.map_rgb(bg)) & rgb_bits
+        pixels = pygame.surfarray.pixels2d(sheet)
+        mask = (pixels & rgb_bits) != packed_bg
+    else:
+        pixels = pygame.surfarray.pixels3d(sheet)
+        mask = np.any(pixels != np.array((bg.r, bg.g, bg.b), dtype=pixels.dtype), axis=2)
+    # Drop the pixel view so the sheet is unlocked before it gets blitted
+    del pixels
+    return mask
+
+def _keyed_crop_mask(rgb, sprite, rect):
+    """Mask of a sheet crop's pixels that differ from its corner, as frame.convert() would see them."""
+    x, y, w, h = rect
+    # Keyed-out background reads as black once the crop is blitted and converted
+    crop = np.where(sprite[x:x + w, y:y + h, None], rgb[x:x + w, y:y + h], 0)
+    return np.any(crop != crop[0, 0], axis=2)
+
+def _column_runs(mask):
+    """Return (x0, x1) ranges of contiguous columns that contain sprite pixels."""
+    col_has = mask.any(axis=1).astype(np.int8)
+    edges = np.diff(np.concatenate(([0], col_has, [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1) - 1
+    return list(zip(starts.tolist(), ends.tolist()))
+
+def _frame_bounds(mask):
+    """Return tight (x0, y0, x1, y1) boxes, one per column run of sprite pixels in a (W, H) mask."""
+    runs = _column_runs(mask)
+    if not runs:
+        return []
+    # Row occupancy of every run in one reduction (gap columns between runs are empty)
+    rows = np.logical_or.reduceat(mask, [x0 for x0, _ in runs], axis=0)
+    top = rows.argmax(axis=1)
+    bottom = rows.shape[1] - 1 - rows[:, ::-1].argmax(axis=1)
+    return [(x0, int(y0), x1, int(y1)) for (x0, x1), y0, y1 in zip(runs, top, bottom)]
+
+def _square_frame_rects(sheet):
+    """Return equal square slices across a horizontal strip (frame width = sheet height)."""
+    sw, sh = sheet.get_width(), sheet.get_height()
+    fw = sh if sh > 0 else sw
+    if fw <= 0:
+        return []
+    return [pygame.Rect(i * fw, 0, fw, sh) for i in range(max(1, sw // fw))]
+
+def _detect_frame_rects(sheet, bg, tight_y=True):
+    """Return one rect per non-background column run (tight or full-height), else square slices."""
+    mask = _non_background_mask(sheet, bg)
+    if tight_y:
+        rects = [pygame.Rect(x0, y0, x1 - x0 + 1, y1 - y0 + 1) for x0, y0, x1, y1 in _frame_bounds(mask)]
+    else:
+        rects = [pygame.Rect(x0, 0, x1 - x0 + 1, sheet.get_height()) for x0, x1 in _column_runs(mask)]
+    return rects or _square_frame_rects(sheet)
+
+_alpha_template = None  # 1x1 surface in the display's per-pixel-alpha format
+
+def _blit_frame(sheet, rect):
+    """Copy rect of a sheet onto its own frame, created directly in the display's alpha format."""
+    global _alpha_template
+    if _alpha_template is None:
+        _alpha_template = pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha()
+    frame = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA, _alpha_template)
+    frame.blit(sheet, (0, 0), rect)
+    return frame
+
+def _largest_component_bounds(mask):
+    """Return (minx, miny, maxx, maxy) of the largest 4-connected blob in a (W, H) mask, or None."""
+    if ndimage is not None:
+        labels, count = ndimage.label(mask)
+        if count == 0:
+            return None
+        sizes = np.bincount(labels.ravel())
+        sizes[0] = 0  # label 0 is the background
+        xs, ys = ndimage.find_objects(labels)[int(sizes.argmax()) - 1]
+        return xs.start, ys.start, xs.stop - 1, ys.stop - 1
+    # Fallback: iterative flood fill over the mask, flattened row-major (index y*w + x)
+    w, h = mask.shape
+    cells = mask.T.astype(np.uint8).tobytes()
+    visited = bytearray(w * h)
+    largest_bounds = None
+    largest_size = 0
+    for x in range(w):
+        for y in range(h):
+            idx = y * w + x
+            if cells[idx] and not visited[idx]:
+                stack = [idx]
+                visited[idx] = 1
+                minx = maxx = x
+                miny = maxy = y
+                size = 0
+                while stack:
+                    idx = stack.pop()
+                    cy, cx = divmod(idx, w)
+                    size += 1
+                    if cx < minx: minx = cx
+                    if cx > maxx: maxx = cx
+                    if cy < miny: miny = cy
+                    if cy > maxy: maxy = cy
+                    if cx > 0:
+                        n = idx - 1
+                        if cells[n] and not visited[n]:
+                            visited[n] = 1
+                            stack.append(n)
+                    if cx < w - 1:
+                        n = idx + 1
+                        if cells[n] and not visited[n]:
+                            visited[n] = 1
+                            stack.append(n)
+                    if cy > 0:
+                        n = idx - w
+                        if cells[n] and not visited[n]:
+                            visited[n] = 1
+                            stack.append(n)
+                    if cy < h - 1:
+                        n = idx + w
+                        if cells[n] and not visited[n]:
+                            visited[n] = 1
+                            stack.append(n)
+                if size > largest_size:
+                    largest_size = size
+                    largest_bounds = (minx, miny, maxx, maxy)
+    return largest_bounds
+
+# --- On-disk cache of sliced sprite frames ---
+SPRITE_CACHE_DIR = ".sprite_cache"
+SPRITE_CACHE_VERSION = 2  # bump when slicing logic changes
+
+def _write_cache_file(cache_path, suffix, write):
+    """Have write(tmp_path) fill a temp file, then rename it over cache_path; the temp file is removed on failure."""
+    os.makedirs(SPRITE_CACHE_DIR, exist_ok=True)
+    # Write to a temp file and rename so a crash never leaves a truncated cache
+    fd, tmp_path = tempfile.mkstemp(dir=SPRITE_CACHE_DIR, suffix=suffix)
+    os.close(fd)
+    replaced = False
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, cache_path)
+        replaced = True
+    finally:
+        if not replaced:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+def _load_or_build(cache_name, source_path, builder):
+    """Return builder()'s frames, reusing a pickled copy while source_path is unchanged."""
+    try:
+        st = os.stat(source_path)
+    except OSError:
+        return builder()
+    key = (SPRITE_CACHE_VERSION, source_path, st.st_mtime, st.st_size)
+    cache_path = os.path.join(SPRITE_CACHE_DIR, cache_name + ".pkl")
+    try:
+        with open(cache_path, "rb") as f:
+            cached_key, entries = pickle.load(f)
+        if cached_key == key:
+            return [pygame.image.frombuffer(raw, (w, h), "RGBA").convert_alpha() for w, h, raw in entries]
+    except Exception:
+        pass
+    frames = builder()
+    if frames:
+        try:
+            entries = [(f.get_width(), f.get_height(), pygame.image.tobytes(f, "RGBA")) for f in frames]
+
+            def write(tmp_path):
+                with open(tmp_path, "wb") as f:
+                    pickle.dump((key, entries), f, protocol=pickle.HIGHEST_PROTOCOL)
+            _write_cache_file(cache_path, ".tmp", write)
+        except Exception:
+            pass
+    return frames
+
+# Background workers for sprite preparation. Image decoding, NumPy reductions and
+# SciPy labelling release the GIL, so independent sheets overlap with each other and
+# with the main thread.
+_sprite_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="sprite-prep")
+
+def _bounded_put(cache, key, value):
+    """Store value in an insertion-ordered dict, evicting the oldest entry past MASK_CACHE_SIZE"""
+    if len(cache) >= MASK_CACHE_SIZE:
+        cache.pop(next(iter(cache)))
+    cache[key] = value
+
+# Outlines of recently drawn masks; the debug overlay redraws the same frames every tick
+_outline_cache = {}
+
+def _mask_outline(mask):
+    """Return mask.outline(), reusing the points while the mask stays among the last few drawn"""
+    outline = _outline_cache.get(mask)
+    if outline is None:
+        outline = mask.outline()
+        _bounded_put(_outline_cache, mask, outline)
+    return outline
+
+def _mask_bounds(surf):
+    """Bounding rect of the pixels pygame.mask.from_surface(surf) would set (alpha above 127)"""
+    return surf.get_bounding_rect(min_alpha=128)
+
+def _lazy_frames(anim, facing_index):
+    """Property returning Mario's right (0) or left (1) facing frames of anim, prepared on first use"""
+    return property(lambda self: self._frames(anim)[facing_index])
+
+def _slice_stand_image(path):
+    """Crop one stand image to its largest sprite cluster (empty list if unreadable)."""
+    try:
+        surf = pygame.image.load(path).convert()
+        # Treat background color as transparent to isolate sprites in sheets with solid BG
+        bg = surf.get_at((0, 0))
+        surf.set_colorkey(bg)
+        # Connected-components over mask to find the single largest sprite cluster
+        largest_bounds = _largest_component_bounds(_non_background_mask(surf, bg))
+        if largest_bounds:
+            x0, y0, x1, y1 = largest_bounds
+            rect = pygame.Rect(x0, y0, x1 - x0 + 1, y1 - y0 + 1)
+            return [surf.subsurface(rect).convert_alpha()]
+        # Fallback: keep as-is with alpha
+        return [surf.convert_alpha()]
+    except Exception:
+        try:
+            return [pygame.image.load(path).convert_alpha()]
+        except Exception:
+            # Skip missing or invalid frames silently
+            return []
 
 class Mario:
     def __init__(self):
@@ -77,6 +351,9 @@ class Mario:
         self.velocity_x = 0
         self.velocity_y = 0
         self.on_ground = True
+        # Per-tick physics constants, resolved once
+        self._floor_y = FLOOR_Y + MARIO_FLOOR_OFFSET
+        self._gravity = 0.6
         self.facing_right = True  # Mario faces right (towards Bowser)
         self.health = 500
         self.ultimate_meter = 0
@@ -96,8 +373,7 @@ class Mario:
         self.stand_surfaces = []
 
         # Attack (hammer) animation sliced from spritesheet
-        # Will be populated after image is loaded
-        self.attack_frames = []
+        # (attack_frames and the other move animations are lazy properties, see _frames)
         self.is_attacking = False
         self.attack_frame_index = 0
         self.attack_timer = 0
@@ -114,10 +390,7 @@ class Mario:
         self.special_index = 0
         self.special_speed = 5
         self.special_has_fired = False
-        self.special_charge_frames = []
-        self.special_release_frames = []
         # Fireball charge overlay frames (sliced from spritesheet)
-        self.special_charge_fx_frames = []
         self.special_charge_fx_index = 0
         self.special_charge_fx_timer = 0
         self.special_charge_fx_speed = 3
@@ -128,12 +401,18 @@ class Mario:
         self.special_charge_duration = 150  # 2.5 seconds at 60 FPS
         self.special_charge_tail_loop = False  # After first full cycle, loop last few frames
         self.special_charge_tail_start = 0  # Computed based on frames
+        self._charge_offsets = self._build_charge_offsets()
+        # Silhouette masks per frame surface (see get_mask)
+        self._mask_cache = {}
+        # Hammer masks per attack frame, indexed by facing_right (see _attack_masks)
+        self._attack_mask_sets = [None, None]
+        self._attack_box_dims = None
         # Track which side Bowser is on to update facing only when crossing sides
         self._last_bowser_side = None  # -1 if Bowser is left of Mario, +1 if right
+        self._opponent = None  # Bowser, linked by _set_opponents()
 
         # Block state
         self.is_blocking = False
-        self.block_frames = []
         self.block_index = 0
         self.block_timer = 0
         self.block_speed = 6
@@ -143,40 +422,60 @@ class Mario:
         self.hitstun_timer = 0
         self.hitstun_duration = 20
         self.hitstun_linger = 10
-        self.hit_frames = []
         self.hit_anim_timer = 0
         self.hit_anim_speed = 5
         self.hit_anim_index = 0
         self.is_playing_hit = False
+
+        # Per-state frame pickers, indexed by the ANIM_* constants
+        self.anim_state = ANIM_STAND
+        self._anim_handlers = (
+            self._show_stand_frame,
+            self._show_attack_frame,
+            self._show_special_frame,
+            self._show_hit_frame,
+            self._show_block_frame,
+        )
         
         # Create actor for current frame
         self.actor = Actor(self.stand_frames[0])
         self.half_height = self.actor.height / 2
         self.half_width = self.actor.width / 2
         # Align feet to Mario's floor
-        mario_floor = FLOOR_Y + MARIO_FLOOR_OFFSET
+        mario_floor = self._floor_y
         self.y = mario_floor - self.half_height
         self.actor.pos = (self.x, self.y)
 
         # Prepare tightly-cropped stand frames and apply the first one
         self._prepare_stand_frames()
-        if self.stand_surfaces:
-            first = self.stand_surfaces[0]
-            self.actor._surf = first
-            # Update actor dimensions to match first frame
-            self.half_height = first.get_height() / 2
-            self.half_width = first.get_width() / 2
-            self.actor.width = first.get_width()
-            self.actor.height = first.get_height()
-            self.y = mario_floor - self.half_height
-            self.actor.pos = (self.x, self.y)
-
-        # Prepare attack/special frames
-        self._prepare_attack_frames()
-        self._prepare_special_frames()
-        self._prepare_charge_fx_frames()
-        self._prepare_block_frames()
-        self._prepare_hit_frames()
+        first = self.stand_surfaces[0]
+        self.actor._surf = first
+        # Update actor dimensions to match first frame
+        self.half_height = first.get_height() / 2
+        self.half_width = first.get_width() / 2
+        self.actor.width = first.get_width()
+        self.actor.height = first.get_height()
+        self.y = mario_floor - self.half_height
+        self.actor.pos = (self.x, self.y)
+
+        # Pack the stand frames now; they are on screen from the first tick
+        self.frame_rects = {}
+        # anim -> (right-facing views, left-facing views)
+        self._oriented_frames = {}
+        self._pack_frames([("stand", self.stand_surfaces)])
+        self.stand_surfaces = self._oriented_frames["stand"][0]
+        self._frame_key = ("stand", 0, True)
+        self.actor._surf = self.stand_surfaces[0]
+
+        # Slice the move sheets in the background; each is only waited for the first
+        # time one of its animations is used (see _frames)
+        self._pending_sheets = {
+            "attack": _sprite_pool.submit(self._prepare_attack_frames),
+            "special": _sprite_pool.submit(self._prepare_special_frames),
+            "charge_fx": _sprite_pool.submit(self._prepare_charge_fx_frames),
+            "block": _sprite_pool.submit(self._prepare_block_frames),
+            "hit": _sprite_pool.submit(self._prepare_hit_frames),
+        }
     
     def update(self):
         # If in hitstun, process only hitstun/hit animation and skip flameblast logic
@@ -189,7 +488,7 @@ class Mario:
         # ... rest of update logic ...
         # Apply gravity
         if not self.on_ground:
-            self.velocity_y += 0.6
+            self.velocity_y += self._gravity
         
         # Update position
         if self.is_in_hitstun:
@@ -199,13 +498,11 @@ class Mario:
         self.y += self.velocity_y
         
         # Always face Bowser every frame
-        try:
-            self.facing_right = (bowser.x >= self.x)
-        except Exception:
-            pass
+        if self._opponent is not None:
+            self.facing_right = (self._opponent.x >= self.x)
 
         # Ground collision
-        mario_floor = FLOOR_Y + MARIO_FLOOR_OFFSET
+        mario_floor = self._floor_y
         if self.y + self.half_height >= mario_floor:  # Ground level aligned with background floor + offset
             self.y = mario_floor - self.half_height
             self.velocity_y = 0
@@ -288,90 +585,11 @@ class Mario:
             self.animation_timer += 1
             if self.animation_timer >= self.animation_speed:
                 self.animation_timer = 0
-                self.animation_frame = (self.animation_frame + 1) % len(self.stand_frames)
+                self.animation_frame = (self.animation_frame + 1) % len(self.stand_surfaces)
                 
         # Pick current image: block > hit > special > attack > stand
-        if self.is_blocking and self.block_frames:
-            current_surface = self.block_frames[self.block_index]
-            feet_y = self.y + self.half_height
-            self.half_height = current_surface.get_height() / 2
-            self.half_width = current_surface.get_width() / 2
-            self.y = feet_y - self.half_height
-            surf = current_surface
-            if not self.facing_right:
-                surf = pygame.transform.flip(surf, True, False)
-            self.actor._surf = surf
-            # Match actor dimensions
-            self.actor.width = current_surface.get_width()
-            self.actor.height = current_surface.get_height()
-        elif self.is_playing_hit and self.hit_frames:
-            current_surface = self.hit_frames[self.hit_anim_index]
-            feet_y = self.y + self.half_height
-            self.half_height = current_surface.get_height() / 2
-            self.half_width = current_surface.get_width() / 2
-            self.y = feet_y - self.half_height
-            surf = current_surface
-            if not self.facing_right:
-                surf = pygame.transform.flip(surf, True, False)
-            self.actor._surf = surf
-        elif self.is_special and (self.special_charge_frames or self.special_release_frames):
-            frames = self.special_charge_frames if self.special_phase == "charge" else self.special_release_frames
-            idx = max(0, min(self.special_index, len(frames) - 1))
-            current_surface = frames[idx]
-            feet_y = self.y + self.half_height
-            self.half_height = current_surface.get_height() / 2
-            self.half_width = current_surface.get_width() / 2
-            self.y = feet_y - self.half_height
-            surf = current_surface
-            if not self.facing_right:
-                surf = pygame.transform.flip(surf, True, False)
-            self.actor._surf = surf
-            # Update actor dimensions to match current frame (like Bowser does)
-            self.actor.width = current_surface.get_width()
-            self.actor.height = current_surface.get_height()
-        elif self.is_playing_hit and self.hit_frames:
-            self.hit_anim_timer += 1
-            if self.hit_anim_timer >= self.hit_anim_speed:
-                self.hit_anim_timer = 0
-                if self.hit_anim_index < len(self.hit_frames) - 1:
-                    self.hit_anim_index += 1
-        elif self.is_attacking and self.attack_frames and not self.is_special and not self.is_blocking:
-            current_surface = self.attack_frames[self.attack_frame_index]
-            # On first attack frame, record feet anchor and enable vertical lock
-            if not self.attack_lock_vertical:
-                self.attack_anchor_feet_y = self.y + self.half_height
-                self.attack_lock_vertical = True
-            # Keep feet locked to the stored anchor while swapping frame height
-            feet_y = self.attack_anchor_feet_y if self.attack_anchor_feet_y is not None else (self.y + self.half_height)
-            self.half_height = current_surface.get_height() / 2
-            self.half_width = current_surface.get_width() / 2
-            self.y = feet_y - self.half_height
-            # Swap actor surface to tightly-cropped frame with orientation
-            surf = current_surface
-            if not self.facing_right:
-                surf = pygame.transform.flip(surf, True, False)
-            self.actor._surf = surf
-            # Update actor dimensions to match current frame (like Bowser does)
-            self.actor.width = current_surface.get_width()
-            self.actor.height = current_surface.get_height()
-        else:
-            if self.stand_surfaces:
-                current_surface = self.stand_surfaces[self.animation_frame]
-                feet_y = self.y + self.half_height
-                self.half_height = current_surface.get_height() / 2
-                self.half_width = current_surface.get_width() / 2
-                self.y = feet_y - self.half_height
-                surf = current_surface
-                if not self.facing_right:
-                    surf = pygame.transform.flip(surf, True, False)
-                self.actor._surf = surf
-                # Update actor dimensions to match current frame (like Bowser does)
-                self.actor.width = current_surface.get_width()
-                self.actor.height = current_surface.get_height()
-            else:
-                self.actor.image = self.stand_frames[self.animation_frame]
-                self.half_height = self.actor.height / 2
-                self.half_width = self.actor.width / 2
+        self.anim_state = self._resolve_anim_state()
+        self._anim_handlers[self.anim_state]()
         
         # If attack vertical lock is active, keep feet anchored at attack start
         if self.is_attacking and self.attack_lock_vertical and self.attack_anchor_feet_y is not None:
@@ -384,7 +602,7 @@ class Mario:
             self.y = self._pre_attack_y
             del self._pre_attack_y
             # Ensure Mario is properly positioned on the ground after restoration
-            mario_floor = FLOOR_Y + MARIO_FLOOR_OFFSET
+            mario_floor = self._floor_y
             if self.y + self.half_height >= mario_floor:
                 self.y = mario_floor - self.half_height
                 self.velocity_y = 0
@@ -393,9 +611,6 @@ class Mario:
         # Update actor position
         self.actor.pos = (self.x, self.y)
         
-        # We already oriented surfaces directly; do not flip again
-        self.actor.flip_x = False
-        
         # Hitstun tick & linger
         if self.is_in_hitstun:
             self.hitstun_timer -= 1
@@ -421,458 +636,309 @@ class Mario:
         self._hit_linger_timer = self.hitstun_linger
     
     def draw(self):
-        # Draw Mario base sprite first
-        self.actor.draw()
+        # Draw Mario base sprite first, straight from the atlas
+        entry = self.frame_rects.get(self._frame_key)
+        if entry is not None:
+            atlas, rect = entry
+            pgzero.game.screen.blit(atlas, self.actor.topleft, rect)
+        else:
+            self.actor.draw()
         # Then overlay the charge effect on top of Mario's hands
         if self.is_special and self.special_phase == "charge" and self.special_charge_fx_frames:
-            fx_surf = self.special_charge_fx_frames[self.special_charge_fx_index]
-            self.special_charge_fx_actor._surf = fx_surf
             # Use cached position to ensure draw and spawn match exactly
             if self.charge_fx_x is None or self.charge_fx_y is None:
                 x_off, y_off = self._compute_charge_offsets()
                 self.charge_fx_x = self.x + x_off
                 self.charge_fx_y = self.y + y_off
             self.special_charge_fx_actor.pos = (self.charge_fx_x, self.charge_fx_y)
-            self.special_charge_fx_actor.flip_x = not self.facing_right
-            self.special_charge_fx_actor.draw()
+            # The overlay is drawn unmirrored (Actor has no flip support)
+            entry = self.frame_rects.get(("charge_fx", self.special_charge_fx_index, True))
+            if entry is not None:
+                atlas, rect = entry
+                pgzero.game.screen.blit(atlas, self.special_charge_fx_actor.topleft, rect)
+            else:
+                self.special_charge_fx_actor._surf = self.special_charge_fx_frames[self.special_charge_fx_index]
+                self.special_charge_fx_actor.draw()
+
+    # Move animations: anim -> (sheet it is sliced from, first frame, end frame)
+    _ANIM_SHEETS = {
+        "attack": ("attack", 0, None),
+        "hit": ("hit", 0, None),
+        "block": ("block", 0, None),
+        # Special sheet: first 6 frames charge, next 5 release
+        "special_charge": ("special", 0, 6),
+        "special_release": ("special", 6, 11),
+        "charge_fx": ("charge_fx", 0, None),
+    }
+
+    attack_frames = _lazy_frames("attack", 0)
+    attack_frames_left = _lazy_frames("attack", 1)
+    hit_frames = _lazy_frames("hit", 0)
+    block_frames = _lazy_frames("block", 0)
+    special_charge_frames = _lazy_frames("special_charge", 0)
+    special_release_frames = _lazy_frames("special_release", 0)
+    special_charge_fx_frames = _lazy_frames("charge_fx", 0)
+
+    def _frames(self, anim):
+        """Return (right-facing, left-facing) frames of anim, waiting for its sheet on first use"""
+        frames = self._oriented_frames.get(anim)
+        if frames is None:
+            sheet = self._ANIM_SHEETS[anim][0]
+            sheet_frames = self._pending_sheets.pop(sheet).result()
+            self._pack_frames([(name, sheet_frames[start:stop])
+                               for name, (src, start, stop) in self._ANIM_SHEETS.items() if src == sheet])
+            frames = self._oriented_frames[anim]
+        return frames
+
+    def _pack_frames(self, anims):
+        """Pack (anim, frames) lists and their mirrored copies into one atlas surface.
+
+        Frames are registered in frame_rects and _oriented_frames as views into the atlas.
+        """
+        all_frames = [f for _, frames in anims for f in frames]
+        atlas = None
+        row_h = 0
+        if all_frames:
+            # Right-facing frames along the top row, mirrored copies directly below
+            total_w = sum(f.get_width() for f in all_frames)
+            row_h = max(f.get_height() for f in all_frames)
+            atlas = pygame.Surface((total_w, row_h * 2), pygame.SRCALPHA).convert_alpha()
+        x = 0
+        for anim, frames in anims:
+            views = []
+            views_left = []
+            for i, frame in enumerate(frames):
+                w, h = frame.get_size()
+                right = pygame.Rect(x, 0, w, h)
+                left = pygame.Rect(x, row_h, w, h)
+                atlas.blit(frame, right)
+                atlas.blit(pygame.transform.flip(frame, True, False), left)
+                self.frame_rects[(anim, i, True)] = (atlas, right)
+                self.frame_rects[(anim, i, False)] = (atlas, left)
+                views.append(atlas.subsurface(right))
+                views_left.append(atlas.subsurface(left))
+                x += w
+            self._oriented_frames[anim] = (views, views_left)
+
+    def _resolve_anim_state(self):
+        """Return the ANIM_* state to show this tick (block > hit > special > attack > stand)"""
+        if self.is_blocking and self.block_frames:
+            return ANIM_BLOCK
+        if self.is_playing_hit and self.hit_frames:
+            return ANIM_HIT
+        if self.is_special and (self.special_charge_frames or self.special_release_frames):
+            return ANIM_SPECIAL
+        if self.is_attacking and self.attack_frames and not self.is_special and not self.is_blocking:
+            return ANIM_ATTACK
+        return ANIM_STAND
+
+    def _show_stand_frame(self):
+        self._apply_frame("stand", self.animation_frame)
+
+    def _show_attack_frame(self):
+        # On first attack frame, record feet anchor and enable vertical lock
+        if not self.attack_lock_vertical:
+            self.attack_anchor_feet_y = self.y + self.half_height
+            self.attack_lock_vertical = True
+        # Keep feet locked to the stored anchor while swapping frame height
+        self._apply_frame("attack", self.attack_frame_index, feet_y=self.attack_anchor_feet_y)
+
+    def _show_special_frame(self):
+        frames = self.special_charge_frames if self.special_phase == "charge" else self.special_release_frames
+        idx = max(0, min(self.special_index, len(frames) - 1))
+        self._apply_frame("special_charge" if self.special_phase == "charge" else "special_release", idx)
+
+    def _show_hit_frame(self):
+        # Advance through the hit frames, then hold the last one
+        self.hit_anim_timer += 1
+        if self.hit_anim_timer >= self.hit_anim_speed:
+            self.hit_anim_timer = 0
+            if self.hit_anim_index < len(self.hit_frames) - 1:
+                self.hit_anim_index += 1
+        # Hit frames keep the previous actor dimensions
+        self._apply_frame("hit", self.hit_anim_index, resize_actor=False)
+
+    def _show_block_frame(self):
+        self._apply_frame("block", self.block_index)
+
+    def _apply_frame(self, anim, idx, feet_y=None, resize_actor=True):
+        """Show frame idx of anim for the current facing, keeping the feet in place.
+
+        Does nothing while the same frame is already shown, which is most ticks.
+        """
+        key = (anim, idx, self.facing_right)
+        if key == self._frame_key:
+            return
+        right, left = self._frames(anim)
+        surf = (right if self.facing_right else left)[idx]
+        w, h = surf.get_size()
+        if feet_y is None:
+            feet_y = self.y + self.half_height
+        self.half_height = h / 2
+        self.half_width = w / 2
+        self.y = feet_y - self.half_height
+        self._frame_key = key
+        self.actor._surf = surf
+        if resize_actor:
+            # Match actor dimensions (like Bowser does)
+            self.actor.width = w
+            self.actor.height = h
 
     def _prepare_attack_frames(self):
+        return _load_or_build("mario_hammer_attack", "images/mario_hammer_attack.png", self._slice_attack_frames)
+
+    def _slice_attack_frames(self):
         try:
             sheet = pygame.image.load("images/mario_hammer_attack.png").convert()
             bg = sheet.get_at((0, 0))
             sheet.set_colorkey(bg)  # treat background as transparent
-            sheet_w, sheet_h = sheet.get_width(), sheet.get_height()
-
-            # Determine columns that contain non-background pixels
-            non_bg_cols = []
-            for x in range(sheet_w):
-                col_has_sprite = False
-                for y in range(sheet_h):
-                    if sheet.get_at((x, y)) != bg:
-                        col_has_sprite = True
-                        break
-                non_bg_cols.append(col_has_sprite)
-
-            # Find contiguous ranges of sprite columns (these are frames)
-            ranges = []
-            in_run = False
-            run_start = 0
-            for x, has in enumerate(non_bg_cols):
-                if has and not in_run:
-                    in_run = True
-                    run_start = x
-                elif not has and in_run:
-                    in_run = False
-                    ranges.append((run_start, x - 1))
-            if in_run:
-                ranges.append((run_start, sheet_w - 1))
-
-            frames = []
-            for x0, x1 in ranges:
-                # Compute tight vertical bounds for this frame
-                min_y = sheet_h
-                max_y = 0
-                for x in range(x0, x1 + 1):
-                    for y in range(sheet_h):
-                        if sheet.get_at((x, y)) != bg:
-                            if y < min_y:
-                                min_y = y
-                            if y > max_y:
-                                max_y = y
-                if min_y > max_y:
-                    continue
-                rect = pygame.Rect(x0, min_y, (x1 - x0 + 1), (max_y - min_y + 1))
-                frame = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-                frame.blit(sheet, (0, 0), rect)
-                frames.append(frame.convert_alpha())
 
-            # Fallback to equal-width slicing if detection failed
-            if not frames:
-                frame_w = sheet_h
-                if frame_w > 0:
-                    num_frames = max(1, sheet_w // frame_w)
-                    for i in range(num_frames):
-                        rect = pygame.Rect(i * frame_w, 0, frame_w, sheet_h)
-                        frame = pygame.Surface((frame_w, sheet_h), pygame.SRCALPHA)
-                        frame.blit(sheet, (0, 0), rect)
-                        frames.append(frame)
-
-            self.attack_frames = frames
+            # Contiguous ranges of sprite columns are the individual frames, cropped tight
+            return [sheet.subsurface(rect).convert_alpha() for rect in _detect_frame_rects(sheet, bg)]
         except Exception:
-            self.attack_frames = []
+            return []
 
     def _prepare_hit_frames(self):
+        return _load_or_build("mario_hit", "images/mario_hit.png", self._slice_hit_frames)
+
+    def _slice_hit_frames(self):
         try:
             sheet = pygame.image.load("images/mario_hit.png").convert()
             bg = sheet.get_at((0, 0))
             sheet.set_colorkey(bg)
-            sw, sh = sheet.get_width(), sheet.get_height()
             # Detect non-background column runs across the sheet
-            non_bg_cols = []
-            for x in range(sw):
-                col_has = False
-                for y in range(sh):
-                    if sheet.get_at((x, y)) != bg:
-                        col_has = True
-                        break
-                non_bg_cols.append(col_has)
-            ranges = []
-            in_run = False
-            start = 0
-            for x, has in enumerate(non_bg_cols):
-                if has and not in_run:
-                    in_run = True
-                    start = x
-                elif not has and in_run:
-                    in_run = False
-                    ranges.append((start, x - 1))
-            if in_run:
-                ranges.append((start, sw - 1))
+            mask2d = _non_background_mask(sheet, bg)
+            rgb = pygame.surfarray.array3d(sheet)
             frames = []
-            for x0, x1 in ranges:
-                # Tight vertical crop for this frame slice
-                min_y, max_y = sh, 0
-                for x in range(x0, x1 + 1):
-                    for y in range(sh):
-                        if sheet.get_at((x, y)) != bg:
-                            if y < min_y: min_y = y
-                            if y > max_y: max_y = y
-                if min_y <= max_y:
-                    rect = pygame.Rect(x0, min_y, (x1 - x0 + 1), (max_y - min_y + 1))
-                    frame = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-                    frame.blit(sheet, (0, 0), rect)
-                    # Further crop to largest connected component to strip lingering pixels
-                    try:
-                        tmp = frame.convert()
-                        tmp.set_colorkey(tmp.get_at((0, 0)))
-                        mask = pygame.mask.from_surface(tmp)
-                        w, h = frame.get_width(), frame.get_height()
-                        visited = set()
-                        largest_bounds = None
-                        largest_size = 0
-                        for ix in range(w):
-                            for iy in range(h):
-                                if mask.get_at((ix, iy)) and (ix, iy) not in visited:
-                                    stack = [(ix, iy)]
-                                    visited.add((ix, iy))
-                                    minx = maxx = ix
-                                    miny = maxy = iy
-                                    size = 0
-                                    while stack:
-                                        cx, cy = stack.pop()
-                                        size += 1
-                                        if cx < minx: minx = cx
-                                        if cx > maxx: maxx = cx
-                                        if cy < miny: miny = cy
-                                        if cy > maxy: maxy = cy
-                                        for nx, ny in ((cx - 1, cy), (cx + 1, cy), (cx, cy - 1), (cx, cy + 1)):
-                                            if 0 <= nx < w and 0 <= ny < h and (nx, ny) not in visited and mask.get_at((nx, ny)):
-                                                visited.add((nx, ny))
-                                                stack.append((nx, ny))
-                                    if size > largest_size:
-                                        largest_size = size
-                                        largest_bounds = (minx, miny, maxx, maxy)
-                        if largest_bounds:
-                            xA, yA, xB, yB = largest_bounds
-                            rect2 = pygame.Rect(xA, yA, xB - xA + 1, yB - yA + 1)
-                            tight = pygame.Surface((rect2.width, rect2.height), pygame.SRCALPHA)
-                            tight.blit(frame, (0, 0), rect2)
-                            frames.append(tight.convert_alpha())
-                        else:
-                            frames.append(frame.convert_alpha())
-                    except Exception:
-                        frames.append(frame.convert_alpha())
-            self.hit_frames = frames
+            for x0, min_y, x1, max_y in _frame_bounds(mask2d):
+                # Tight crop for this frame slice
+                rect = pygame.Rect(x0, min_y, (x1 - x0 + 1), (max_y - min_y + 1))
+                frame = _blit_frame(sheet, rect)
+                # Further crop to largest connected component to strip lingering pixels
+                try:
+                    mask = _keyed_crop_mask(rgb, mask2d, rect)
+                    largest_bounds = _largest_component_bounds(mask)
+                    if largest_bounds:
+                        xA, yA, xB, yB = largest_bounds
+                        rect2 = pygame.Rect(xA, yA, xB - xA + 1, yB - yA + 1)
+                        frames.append(frame.subsurface(rect2).copy())
+                    else:
+                        frames.append(frame)
+                except Exception:
+                    frames.append(frame)
+            return frames
         except Exception:
-            self.hit_frames = []
+            return []
 
     def _prepare_stand_frames(self):
         """Prepare stand animation frames and set the actor's _surf attribute"""
         frames = []
         for name in self.stand_frames:
-            try:
-                surf = pygame.image.load(f"images/{name}.png").convert()
-                # Treat background color as transparent to isolate sprites in sheets with solid BG
-                bg = surf.get_at((0, 0))
-                surf.set_colorkey(bg)
-                mask = pygame.mask.from_surface(surf)
-                w, h = surf.get_width(), surf.get_height()
-                visited = set()
-                largest_bounds = None
-                largest_size = 0
-                # Connected-components over mask to find the single largest sprite cluster
-                for x in range(w):
-                    for y in range(h):
-                        if mask.get_at((x, y)) and (x, y) not in visited:
-                            stack = [(x, y)]
-                            visited.add((x, y))
-                            minx = maxx = x
-                            miny = maxy = y
-                            size = 0
-                            while stack:
-                                cx, cy = stack.pop()
-                                size += 1
-                                if cx < minx: minx = cx
-                                if cx > maxx: maxx = cx
-                                if cy < miny: miny = cy
-                                if cy > maxy: maxy = cy
-                                for nx, ny in ((cx - 1, cy), (cx + 1, cy), (cx, cy - 1), (cx, cy + 1)):
-                                    if 0 <= nx < w and 0 <= ny < h and (nx, ny) not in visited and mask.get_at((nx, ny)):
-                                        visited.add((nx, ny))
-                                        stack.append((nx, ny))
-                            if size > largest_size:
-                                largest_size = size
-                                largest_bounds = (minx, miny, maxx, maxy)
-                if largest_bounds:
-                    x0, y0, x1, y1 = largest_bounds
-                    rect = pygame.Rect(x0, y0, x1 - x0 + 1, y1 - y0 + 1)
-                    frame = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-                    frame.blit(surf, (0, 0), rect)
-                    frames.append(frame.convert_alpha())
-                else:
-                    # Fallback: keep as-is with alpha
-                    frames.append(surf.convert_alpha())
-            except Exception:
-                try:
-                    frames.append(pygame.image.load(f"images/{name}.png").convert_alpha())
-                except Exception:
-                    # Skip missing or invalid frames silently
-                    pass
+            path = f"images/{name}.png"
+            frames.extend(_load_or_build(name, path, lambda path=path: _slice_stand_image(path)))
+        if not frames:
+            # Nothing could be cropped: stand still on the uncropped image the actor loaded
+            frames = [self.actor._surf]
         
         # Store the frames and set the actor's _surf attribute
         self.stand_surfaces = frames
-        if frames:
-            first = frames[0]
-            self.actor._surf = first
-            # Update actor dimensions to match first frame
-            self.actor.width = first.get_width()
-            self.actor.height = first.get_height()
-            self.half_width = self.actor.width / 2
-            self.half_height = self.actor.height / 2
+        first = frames[0]
+        self.actor._surf = first
+        # Update actor dimensions to match first frame
+        self.actor.width = first.get_width()
+        self.actor.height = first.get_height()
+        self.half_width = self.actor.width / 2
+        self.half_height = self.actor.height / 2
     
     def _prepare_special_frames(self):
+        # Split into charge/release phases by _ANIM_SHEETS
+        return _load_or_build("mario_special", "images/mario_special.png", self._slice_special_frames)
+
+    def _slice_special_frames(self):
         try:
             sheet = pygame.image.load("images/mario_special.png").convert()
             bg = sheet.get_at((0, 0))
             sheet.set_colorkey(bg)
-            sw, sh = sheet.get_width(), sheet.get_height()
             # Tight slice by non-bg column runs (same approach as hammer)
-            non_bg_cols = []
-            for x in range(sw):
-                col_has = False
-                for y in range(sh):
-                    if sheet.get_at((x, y)) != bg:
-                        col_has = True
-                        break
-                non_bg_cols.append(col_has)
-            ranges = []
-            in_run = False
-            start = 0
-            for x, has in enumerate(non_bg_cols):
-                if has and not in_run:
-                    in_run = True
-                    start = x
-                elif not has and in_run:
-                    in_run = False
-                    ranges.append((start, x - 1))
-            if in_run:
-                ranges.append((start, sw - 1))
-            frames = []
-            for x0, x1 in ranges:
-                min_y, max_y = sh, 0
-                for x in range(x0, x1 + 1):
-                    for y in range(sh):
-                        if sheet.get_at((x, y)) != bg:
-                            if y < min_y: min_y = y
-                            if y > max_y: max_y = y
-                if min_y <= max_y:
-                    rect = pygame.Rect(x0, min_y, (x1 - x0 + 1), (max_y - min_y + 1))
-                    frame = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-                    frame.blit(sheet, (0, 0), rect)
-                    frames.append(frame.convert_alpha())
-            # Fallback to square slicing if needed
-            if not frames:
-                fw = sh if sh > 0 else sw
-                if fw > 0:
-                    count = max(1, sw // fw)
-                    for i in range(count):
-                        rect = pygame.Rect(i * fw, 0, fw, sh)
-                        frame = pygame.Surface((fw, sh), pygame.SRCALPHA)
-                        frame.blit(sheet, (0, 0), rect)
-                        frames.append(frame.convert_alpha())
-            # Split into phases: first 6 charge, next 5 release
-            self.special_charge_frames = frames[:6]
-            self.special_release_frames = frames[6:11]
+            return [sheet.subsurface(rect).convert_alpha() for rect in _detect_frame_rects(sheet, bg)]
         except Exception:
-            self.special_charge_frames = []
-            self.special_release_frames = []
+            return []
 
     def _prepare_charge_fx_frames(self):
+        return _load_or_build("mario_fireball_charge", "images/mario_fireball_charge.png", self._slice_charge_fx_frames)
+
+    def _slice_charge_fx_frames(self):
         try:
             sheet = pygame.image.load("images/mario_fireball_charge.png").convert()
             bg = sheet.get_at((0, 0))
             sheet.set_colorkey(bg)
-            sw, sh = sheet.get_width(), sheet.get_height()
             # Tight crop each frame by scanning non-background columns and rows
-            non_bg_cols = []
-            for x in range(sw):
-                col_has = False
-                for y in range(sh):
-                    if sheet.get_at((x, y)) != bg:
-                        col_has = True
-                        break
-                non_bg_cols.append(col_has)
-            ranges = []
-            in_run = False
-            start = 0
-            for x, has in enumerate(non_bg_cols):
-                if has and not in_run:
-                    in_run = True
-                    start = x
-                elif not has and in_run:
-                    in_run = False
-                    ranges.append((start, x - 1))
-            if in_run:
-                ranges.append((start, sw - 1))
-            frames = []
-            for x0, x1 in ranges:
-                min_y, max_y = sh, 0
-                for x in range(x0, x1 + 1):
-                    for y in range(sh):
-                        if sheet.get_at((x, y)) != bg:
-                            if y < min_y: min_y = y
-                            if y > max_y: max_y = y
-                if min_y <= max_y:
-                    rect = pygame.Rect(x0, min_y, (x1 - x0 + 1), (max_y - min_y + 1))
-                    frame = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-                    frame.blit(sheet, (0, 0), rect)
-                    frames.append(frame.convert_alpha())
-            # Fallback to square slicing if needed
-            if not frames:
-                fw = sh if sh > 0 else sw
-                if fw > 0:
-                    count = max(1, sw // fw)
-                    for i in range(count):
-                        rect = pygame.Rect(i * fw, 0, fw, sh)
-                        frame = pygame.Surface((fw, sh), pygame.SRCALPHA)
-                        frame.blit(sheet, (0, 0), rect)
-                        frames.append(frame.convert_alpha())
-            self.special_charge_fx_frames = frames
+            return [sheet.subsurface(rect).convert_alpha() for rect in _detect_frame_rects(sheet, bg)]
         except Exception:
-            self.special_charge_fx_frames = []
+            return []
 
-    def _compute_charge_offsets(self):
+    @staticmethod
+    def _build_charge_offsets():
+        """Return per-frame (dx, dy) overlay offsets, as (facing_left, facing_right) tables"""
         # Per-frame fine offsets to better center in gloves
         # Tune so the FX sits on Mario's right-hand white glove
         # Nudge more to glove center
         per_frame_dx = [10, 12, 13, 14, 14, 15, 15, 15]
         per_frame_dy = [-1, -1, 0, 0, 1, 1, 1, 1]
-        idx = min(self.special_charge_fx_index, len(per_frame_dx) - 1)
-        base_dx = CHARGE_OFFSET_X + per_frame_dx[idx]
-        dx = base_dx if self.facing_right else -base_dx
-        dy = CHARGE_OFFSET_Y + per_frame_dy[idx]
-        # Global nudge: move right and up on screen (current left-facing kept as-is)
-        dx += 80
-        # When facing right, pull 75px left to be closer to glove center
-        if self.facing_right:
-            dx -= 155
-        dy -= 10
-        return dx, dy
+        tables = ([], [])
+        for facing_right in (False, True):
+            for fdx, fdy in zip(per_frame_dx, per_frame_dy):
+                base_dx = CHARGE_OFFSET_X + fdx
+                dx = base_dx if facing_right else -base_dx
+                dy = CHARGE_OFFSET_Y + fdy
+                # Global nudge: move right and up on screen (current left-facing kept as-is)
+                dx += 80
+                # When facing right, pull 75px left to be closer to glove center
+                if facing_right:
+                    dx -= 155
+                dy -= 10
+                tables[facing_right].append((dx, dy))
+        return tables
+
+    def _compute_charge_offsets(self):
+        # Offsets only depend on facing and the overlay frame, so they are precomputed
+        table = self._charge_offsets[self.facing_right]
+        return table[min(self.special_charge_fx_index, len(table) - 1)]
 
     def _prepare_block_frames(self):
+        return _load_or_build("mario_block", "images/mario_block.png", self._slice_block_frames)
+
+    def _slice_block_frames(self):
         try:
             sheet = pygame.image.load("images/mario_block.png").convert()
             bg = sheet.get_at((0, 0))
             sheet.set_colorkey(bg)
-            sw, sh = sheet.get_width(), sheet.get_height()
             # Detect non-background columns to find per-frame horizontal slices
-            non_bg_cols = []
-            for x in range(sw):
-                col_has = False
-                for y in range(sh):
-                    if sheet.get_at((x, y)) != bg:
-                        col_has = True
-                        break
-                non_bg_cols.append(col_has)
-            ranges = []
-            in_run = False
-            start = 0
-            for x, has in enumerate(non_bg_cols):
-                if has and not in_run:
-                    in_run = True
-                    start = x
-                elif not has and in_run:
-                    in_run = False
-                    ranges.append((start, x - 1))
-            if in_run:
-                ranges.append((start, sw - 1))
+            mask2d = _non_background_mask(sheet, bg)
+            rgb = pygame.surfarray.array3d(sheet)
             frames = []
-            for x0, x1 in ranges:
+            for x0, min_y, x1, max_y in _frame_bounds(mask2d):
                 # Tight vertical crop for this frame
-                min_y, max_y = sh, 0
-                for x in range(x0, x1 + 1):
-                    for y in range(sh):
-                        if sheet.get_at((x, y)) != bg:
-                            if y < min_y: min_y = y
-                            if y > max_y: max_y = y
-                if min_y <= max_y:
-                    rect = pygame.Rect(x0, min_y, (x1 - x0 + 1), (max_y - min_y + 1))
-                    frame = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-                    frame.blit(sheet, (0, 0), rect)
-                    # Further crop to the largest connected component to remove lingering parts
-                    try:
-                        tmp = frame.convert()
-                        tmp.set_colorkey(tmp.get_at((0, 0)))
-                        mask = pygame.mask.from_surface(tmp)
-                        w, h = frame.get_width(), frame.get_height()
-                        visited = set()
-                        largest_bounds = None
-                        largest_size = 0
-                        for ix in range(w):
-                            for iy in range(h):
-                                if mask.get_at((ix, iy)) and (ix, iy) not in visited:
-                                    stack = [(ix, iy)]
-                                    visited.add((ix, iy))
-                                    minx = maxx = ix
-                                    miny = maxy = iy
-                                    size = 0
-                                    while stack:
-                                        cx, cy = stack.pop()
-                                        size += 1
-                                        if cx < minx: minx = cx
-                                        if cx > maxx: maxx = cx
-                                        if cy < miny: miny = cy
-                                        if cy > maxy: maxy = cy
-                                        for nx, ny in ((cx - 1, cy), (cx + 1, cy), (cx, cy - 1), (cx, cy + 1)):
-                                            if 0 <= nx < w and 0 <= ny < h and (nx, ny) not in visited and mask.get_at((nx, ny)):
-                                                visited.add((nx, ny))
-                                                stack.append((nx, ny))
-                                    if size > largest_size:
-                                        largest_size = size
-                                        largest_bounds = (minx, miny, maxx, maxy)
-                        if largest_bounds:
-                            xA, yA, xB, yB = largest_bounds
-                            rect2 = pygame.Rect(xA, yA, xB - xA + 1, yB - yA + 1)
-                            tight = pygame.Surface((rect2.width, rect2.height), pygame.SRCALPHA)
-                            tight.blit(frame, (0, 0), rect2)
-                            frames.append(tight.convert_alpha())
-                        else:
-                            frames.append(frame.convert_alpha())
-                    except Exception:
-                        frames.append(frame.convert_alpha())
+                rect = pygame.Rect(x0, min_y, (x1 - x0 + 1), (max_y - min_y + 1))
+                frame = _blit_frame(sheet, rect)
+                # Further crop to the largest connected component to remove lingering parts
+                try:
+                    mask = _keyed_crop_mask(rgb, mask2d, rect)
+                    largest_bounds = _largest_component_bounds(mask)
+                    if largest_bounds:
+                        xA, yA, xB, yB = largest_bounds
+                        rect2 = pygame.Rect(xA, yA, xB - xA + 1, yB - yA + 1)
+                        frames.append(frame.subsurface(rect2).copy())
+                    else:
+                        frames.append(frame)
+                except Exception:
+                    frames.append(frame)
             # Fallback to square slices
             if not frames:
-                fw = sh if sh > 0 else sw
-                if fw > 0:
-                    count = max(1, sw // fw)
-                    for i in range(count):
-                        rect = pygame.Rect(i * fw, 0, fw, sh)
-                        frame = pygame.Surface((fw, sh), pygame.SRCALPHA)
-                        frame.blit(sheet, (0, 0), rect)
-                        frames.append(frame.convert_alpha())
-            self.block_frames = frames
+                frames = [sheet.subsurface(rect).convert_alpha() for rect in _square_frame_rects(sheet)]
+            return frames
         except Exception:
-            self.block_frames = []
+            return []
 
     def _spawn_fireball(self):
         direction = 1 if self.facing_right else -1
@@ -901,46 +967,37 @@ class Mario:
         self.special_charge_tail_loop = False  # Reset charge tail loop
         self.special_charge_tail_start = 0  # Reset charge tail start
 
-    def get_hurtbox(self):
+    def _box_origin(self, width, height):
+        """Calibrated top-left of a width x height box centred on Mario"""
         # Use spawn coordinates as reference point for consistent positioning
-        width = self.actor.width
-        height = self.actor.height
-        # Calculate offset from spawn position
-        offset_x = self.x - self.spawn_x
-        offset_y = self.y - self.spawn_y
-        # While blocking, nudge hurtbox in the direction Mario is facing for glove-forward stance
-        if self.is_blocking:
-            if self.facing_right:
-                block_dx = 80  # 20 + 20 additional pixels right when blocking right
-            else:
-                block_dx = -40  # 20 pixels left when blocking left
-        else:
-            block_dx = 0
-        # Apply offset to spawn-based positioning plus calibration
-        x = int(self.spawn_x - width / 2 + offset_x + MARIO_BOX_OFFSET_X + block_dx)
-        y = int(self.spawn_y - height / 2 + offset_y + MARIO_BOX_OFFSET_Y)
+        spawn_x, spawn_y = self.spawn_x, self.spawn_y
+        # While blocking, nudge the box in the direction Mario is facing for glove-forward stance
+        block_dx = MARIO_BLOCK_BOX_DX[self.facing_right] if self.is_blocking else 0
+        # Apply offset from spawn position plus calibration
+        x = int(spawn_x - width / 2 + (self.x - spawn_x) + MARIO_BOX_OFFSET_X + block_dx)
+        y = int(spawn_y - height / 2 + (self.y - spawn_y) + MARIO_BOX_OFFSET_Y)
+        return x, y
+
+    def get_hurtbox(self):
+        actor = self.actor
+        width, height = actor.width, actor.height
+        x, y = self._box_origin(width, height)
         return Rect(x, y, width, height)
 
     def get_mask(self):
-        # Build a mask for visible pixels; remove near-background colors
-        # Use the same approach as Bowser for consistency
-        surf = self.actor._surf if hasattr(self.actor, '_surf') else None
-        if surf is None:
-            # Fallback to actor's current image if _surf is not available
-            try:
-                return pygame.mask.from_surface(self.actor._surf if hasattr(self.actor, '_surf') else self.actor.image)
-            except Exception:
-                # If all else fails, create a simple rectangular mask
-                return pygame.mask.Mask((self.actor.width, self.actor.height), True)
+        # Build a mask for visible pixels
+        # Use the same approach as Bowser for consistency (the Actor always has a _surf)
+        surf = self.actor._surf
+        # Frames are persistent atlas views, so a frame's mask never changes once built
+        cached = self._mask_cache.get(surf)
+        if cached is not None:
+            return cached
         try:
-            bg = surf.get_at((0, 0))
-            # Full mask (may include background)
+            # Alpha mask of the frame. The old near-background threshold pass was
+            # never applied (Mask.erase needs an offset and always raised into
+            # the from_surface fallback), so build that result directly.
             mask_full = pygame.mask.from_surface(surf)
-            # Background mask using color threshold tolerance
-            tol = (30, 30, 30, 255)
-            mask_bg = pygame.mask.from_threshold(surf, bg, tol)
-            # Subtract background from full to get silhouette
-            mask_full.erase(mask_bg)
+            _bounded_put(self._mask_cache, surf, mask_full)
             return mask_full
         except Exception:
             # If processing fails, return a simple mask from the surface
@@ -952,27 +1009,11 @@ class Mario:
 
     def get_tight_hurtbox(self):
         # Tight bounding rect from current visible surface
-        surf = self.actor._surf if hasattr(self.actor, '_surf') else None
-        if surf is None:
-            return self.get_hurtbox()
+        surf = self.actor._surf
         try:
-            # Use spawn coordinates as reference point for consistent positioning
-            m = self.get_mask()
-            r = m.get_bounding_rect()
-            # Calculate offset from spawn position
-            offset_x = self.x - self.spawn_x
-            offset_y = self.y - self.spawn_y
-            if self.is_blocking:
-                if self.facing_right:
-                    block_dx = 80  # 20 + 20 additional pixels right when blocking right
-                else:
-                    block_dx = -40  # 20 pixels left when blocking left
-            else:
-                block_dx = 0
-            # Apply offset to spawn-based positioning plus calibration
-            top_left_x = int(self.spawn_x - surf.get_width() / 2 + offset_x + MARIO_BOX_OFFSET_X + block_dx) + r.x
-            top_left_y = int(self.spawn_y - surf.get_height() / 2 + offset_y + MARIO_BOX_OFFSET_Y) + r.y
-            return Rect(top_left_x, top_left_y, r.w, r.h)
+            r = _mask_bounds(surf)
+            x, y = self._box_origin(*surf.get_size())
+            return Rect(x + r.x, y + r.y, r.w, r.h)
         except Exception:
             return self.get_hurtbox()
 
@@ -984,14 +1025,10 @@ class Mario:
         if self.attack_frame_index < active_start:
             return None
         try:
-            raw = self.attack_frames[self.attack_frame_index]
-            # Build oriented surface explicitly (do not rely on actor flip)
-            surf = raw if self.facing_right else pygame.transform.flip(raw, True, False)
-            # Build mask from yellow pixels (hammer head)
-            mask = pygame.mask.from_threshold(surf, HAMMER_YELLOW_COLOR, HAMMER_YELLOW_TOLERANCE)
-            if mask.count() == 0:
-                # Fallback to full surface if detection fails
-                mask = pygame.mask.from_surface(surf)
+            # Pre-flipped frame for the current facing (do not rely on actor flip)
+            frames = self.attack_frames if self.facing_right else self.attack_frames_left
+            surf = frames[self.attack_frame_index]
+            mask = self._attack_masks(self.facing_right)[self.attack_frame_index]
             # Position base depending on facing so mask stays on correct side
             if self.facing_right:
                 base_x = int(self.x - surf.get_width() / 2 + HAMMER_HITBOX_OFFSET_X + 130)  # Move 120px right when facing right
@@ -1005,16 +1042,31 @@ class Mario:
         except Exception:
             return None
 
+    def _attack_masks(self, facing_right):
+        """Hammer masks for every attack frame of one facing, built on first use."""
+        masks = self._attack_mask_sets[facing_right]
+        if masks is None:
+            frames = self.attack_frames if facing_right else self.attack_frames_left
+            masks = []
+            for surf in frames:
+                # Build mask from yellow pixels (hammer head)
+                mask = pygame.mask.from_threshold(surf, HAMMER_YELLOW_COLOR, HAMMER_YELLOW_TOLERANCE)
+                if mask.count() == 0:
+                    # Fallback to full surface if detection fails
+                    mask = pygame.mask.from_surface(surf)
+                masks.append(mask)
+            self._attack_mask_sets[facing_right] = masks
+        return masks
+
     def get_attack_hitbox(self):
         if not (self.is_attacking and self.attack_frames):
             return None
         # Create a hitbox extending in front of Mario based on current frame dimensions
-        current_surface = self.attack_frames[self.attack_frame_index]
-        frame_width = current_surface.get_width()
-        frame_height = current_surface.get_height()
-        width = int(frame_width * 0.8)
-        height = int(frame_height * 0.7)
-        forward = frame_width * 0.5
+        if self._attack_box_dims is None:
+            # (width, height, forward reach) per attack frame; the frames never change
+            self._attack_box_dims = [(int(w * 0.8), int(h * 0.7), w * 0.5)
+                                     for w, h in (f.get_size() for f in self.attack_frames)]
+        width, height, forward = self._attack_box_dims[self.attack_frame_index]
         # Compute center relative to current position; mirror horizontally by facing
         center_x = self.x + (forward if self.facing_right else -forward) + MARIO_BOX_OFFSET_X
         x = int(center_x - width / 2)
@@ -1031,6 +1083,7 @@ class Bowser:
         self.velocity_y = 0
         self.on_ground = True
         self.facing_right = False  # Bowser starts facing left (toward Mario)
+        self._opponent = None  # Mario, linked by _set_opponents()
         self.health = 500
         self.ultimate_meter = 0
         # Hitstun state
@@ -1050,6 +1103,17 @@ class Bowser:
         self.animation_frame = 0
         self.animation_timer = 0
         self.animation_speed = 12  # frames per animation update (higher = slower)
+        # Per-state frame pickers, indexed by the BOWSER_ANIM_* constants
+        self.anim_state = BOWSER_ANIM_STAND
+        self._anim_handlers = (
+            self._show_stand_frame,
+            self._show_punch_frame,
+            self._reset_idle_flameblast,
+            self._show_flameblast_frame,
+            self._show_charge_frame,
+            self._show_hit_frame,
+            self._show_block_frame,
+        )
         
         # Create actor for current frame (stand images)
         self.stand_frames = ["bowser_stand1", "bowser_stand2"]
@@ -1106,6 +1170,9 @@ class Bowser:
         # Track which side Mario is on to update facing only when crossing sides
         self._last_mario_side = None  # -1 if Mario is left of Bowser, +1 if right
         
+        # Visible-pixel masks per frame surface (see get_mask)
+        self._mask_cache = {}
+        
         # Block state
         self.is_blocking = False
         self.block_frames = []
@@ -1113,65 +1180,25 @@ class Bowser:
         self.block_timer = 0
         self.block_speed = 6
         
-        # Prepare animation frames
+        # Prepare animation frames; the sheets are independent, so slice them on the
+        # sprite workers while the stand frames are set up here
+        pending = [_sprite_pool.submit(prepare) for prepare in (
+            self._prepare_hit_frames,
+            self._prepare_punch_frames,
+            self._prepare_flameblast_frames,
+            self._prepare_block_frames,
+        )]
         self._prepare_stand_frames()
-        self._prepare_hit_frames()
-        self._prepare_punch_frames()
-        self._prepare_flameblast_frames()
-        self._prepare_block_frames()
+        for job in pending:
+            job.result()
+        self._prepare_right_facing_frames()
     
     def _prepare_stand_frames(self):
         """Prepare stand animation frames and set the actor's _surf attribute"""
         frames = []
         for name in self.stand_frames:
-            try:
-                surf = pygame.image.load(f"images/{name}.png").convert()
-                # Treat background color as transparent to isolate sprites in sheets with solid BG
-                bg = surf.get_at((0, 0))
-                surf.set_colorkey(bg)
-                mask = pygame.mask.from_surface(surf)
-                w, h = surf.get_width(), surf.get_height()
-                visited = set()
-                largest_bounds = None
-                largest_size = 0
-                # Connected-components over mask to find the single largest sprite cluster
-                for x in range(w):
-                    for y in range(h):
-                        if mask.get_at((x, y)) and (x, y) not in visited:
-                            stack = [(x, y)]
-                            visited.add((x, y))
-                            minx = maxx = x
-                            miny = maxy = y
-                            size = 0
-                            while stack:
-                                cx, cy = stack.pop()
-                                size += 1
-                                if cx < minx: minx = cx
-                                if cx > maxx: maxx = cx
-                                if cy < miny: miny = cy
-                                if cy > maxy: maxy = cy
-                                for nx, ny in ((cx - 1, cy), (cx + 1, cy), (cx, cy - 1), (cx, cy + 1)):
-                                    if 0 <= nx < w and 0 <= ny < h and (nx, ny) not in visited and mask.get_at((nx, ny)):
-                                        visited.add((nx, ny))
-                                        stack.append((nx, ny))
-                            if size > largest_size:
-                                largest_size = size
-                                largest_bounds = (minx, miny, maxx, maxy)
-                if largest_bounds:
-                    x0, y0, x1, y1 = largest_bounds
-                    rect = pygame.Rect(x0, y0, x1 - x0 + 1, y1 - y0 + 1)
-                    frame = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-                    frame.blit(surf, (0, 0), rect)
-                    frames.append(frame.convert_alpha())
-                else:
-                    # Fallback: keep as-is with alpha
-                    frames.append(surf.convert_alpha())
-            except Exception:
-                try:
-                    frames.append(pygame.image.load(f"images/{name}.png").convert_alpha())
-                except Exception:
-                    # Skip missing or invalid frames silently
-                    pass
+            path = f"images/{name}.png"
+            frames.extend(_load_or_build(name, path, lambda path=path: _slice_stand_image(path)))
         
         # Store the frames and set the actor's _surf attribute
         self.stand_surfaces = frames
@@ -1184,6 +1211,136 @@ class Bowser:
             self.half_width = self.actor.width / 2
             self.half_height = self.actor.height / 2
     
+    def _prepare_right_facing_frames(self):
+        """Mirror the left-facing animations once so update/draw never flip per tick"""
+        def mirrored(frames):
+            return [pygame.transform.flip(f, True, False) for f in frames]
+        self.block_frames_right = mirrored(self.block_frames)
+        self.hit_frames_right = mirrored(self.hit_frames)
+        self.flameblast_charge_frames_right = mirrored(self.flameblast_charge_frames)
+        self.flameblast_release_frames_right = mirrored(self.flameblast_release_frames)
+        self.flameblast_stream_frames_right = mirrored(self.flameblast_stream_frames)
+        # The stand pose is drawn from the uncropped images (None where unreadable)
+        self.stand_images = []
+        for name in self.stand_frames:
+            try:
+                self.stand_images.append(pygame.image.load(f"images/{name}.png").convert_alpha())
+            except Exception:
+                self.stand_images.append(None)
+        self.stand_images_right = [None if img is None else pygame.transform.flip(img, True, False)
+                                   for img in self.stand_images]
+        # Half extents of every frame Bowser can show, so frame swaps skip the size queries
+        self._half_sizes = {}
+        for frames in (self.block_frames, self.block_frames_right, self.hit_frames, self.hit_frames_right,
+                       self.flameblast_charge_frames, self.flameblast_charge_frames_right,
+                       self.flameblast_release_frames, self.flameblast_release_frames_right,
+                       self.punch_frames, self.punch_frames_left, self.punch_frames_right,
+                       self.stand_images, self.stand_images_right):
+            for frame in frames:
+                if frame is not None:
+                    self._half_sizes[frame] = (frame.get_width() / 2, frame.get_height() / 2)
+        # Their visible-pixel masks too, so hit tests never build one mid-fight
+        self._frame_masks = {frame: pygame.mask.from_surface(frame) for frame in self._half_sizes}
+        # Offset of every flame FX frame from the flame anchor: a small nudge right for
+        # mouth alignment when facing right, 20px further left when facing left
+        self._fx_offsets = {}
+        for fx, fx_right in zip(self.flameblast_stream_frames + [self._fx_fallback],
+                                self.flameblast_stream_frames_right + [self._fx_fallback_right]):
+            if fx is not None:
+                w, h = fx.get_size()
+                self._fx_offsets[fx] = (-w - 20, -(h // 2) - 5)
+                self._fx_offsets[fx_right] = (10, -(h // 2) - 5)
+
+    def _resolve_anim_state(self):
+        """Return the BOWSER_ANIM_* state to show this tick (block > hit > flameblast > attack > stand)"""
+        if self.is_blocking and self.block_frames:
+            return BOWSER_ANIM_BLOCK
+        if self.is_playing_hit and self.hit_frames:
+            return BOWSER_ANIM_HIT
+        if self.is_charging and self.flameblast_charge_frames:
+            return BOWSER_ANIM_CHARGE
+        if self.is_flameblasting:
+            if self.flameblast_phase == "idle":
+                return BOWSER_ANIM_FLAME_RESET
+            if self.flameblast_charge_frames or self.flameblast_release_frames or self.flameblast_stream_frames:
+                return BOWSER_ANIM_FLAMEBLAST
+        if self.is_attacking and (self.punch_frames_left or self.punch_frames) and not self.is_blocking:
+            return BOWSER_ANIM_PUNCH
+        return BOWSER_ANIM_STAND
+
+    def _show_surface(self, surf):
+        """Show surf, keeping Bowser's feet where they were"""
+        half = self._half_sizes.get(surf)
+        if half is None:
+            half = (surf.get_width() / 2, surf.get_height() / 2)
+        feet_y = self.y + self.half_height
+        self.half_width, self.half_height = half
+        self.y = feet_y - self.half_height
+        self.actor._surf = surf
+
+    def _show_frame(self, frames, frames_right, index):
+        # Bowser base sprites assumed left-facing → mirrored copy when facing right
+        self._show_surface((frames_right if self.facing_right else frames)[index])
+
+    def _show_block_frame(self):
+        self._show_frame(self.block_frames, self.block_frames_right, self.block_index)
+
+    def _show_hit_frame(self):
+        self._show_frame(self.hit_frames, self.hit_frames_right, self.hit_anim_index)
+
+    def _show_charge_frame(self):
+        self._show_frame(self.flameblast_charge_frames, self.flameblast_charge_frames_right, self.flameblast_index)
+
+    def _show_flameblast_frame(self):
+        """Show the flameblast body; returns True when update() should stop for this tick"""
+        if self.flameblast_phase == "charge" and self.flameblast_charge_frames:
+            self._show_surface(self.flameblast_charge_frames[self.flameblast_index])
+        elif self.flameblast_phase == "release" and self.flameblast_release_frames:
+            self._show_surface(self.flameblast_release_frames[self.flameblast_index])
+        elif self.flameblast_phase == "stream":
+            # Keep Bowser's body on the 2nd release frame during stream per spec
+            if self.flameblast_release_frames:
+                body_index = min(1, len(self.flameblast_release_frames)-1)
+                self._show_frame(self.flameblast_release_frames, self.flameblast_release_frames_right, body_index)
+            elif self.stand_images[self.animation_frame] is not None:
+                self._show_frame(self.stand_images, self.stand_images_right, self.animation_frame)
+            # Anchor the flame on Bowser's centre. The draw offsets are tuned
+            # against this anchor: the old mouth-edge lookup called
+            # Mask.get_bounding_rect (which does not exist) and always fell back here.
+            self.flame_left = int(self.x)
+            self.flame_top = int(self.y)
+        else:
+            # Fallback to stand frames if flameblast frames aren't loaded
+            # Use the preloaded stand image oriented by facing
+            if self.stand_images[self.animation_frame] is not None:
+                self._show_frame(self.stand_images, self.stand_images_right, self.animation_frame)
+            return True
+
+    def _reset_idle_flameblast(self):
+        # Safety check: if flameblast is marked as active but phase is idle, force reset
+        self.is_flameblasting = False
+        self.is_charging = False
+        self.flameblast_phase = "idle"
+
+    def _show_punch_frame(self):
+        # Use directional punch frames (left raw, right flipped)
+        if self.punch_frames_left:
+            self._show_frame(self.punch_frames_left, self.punch_frames_right, self.attack_frame_index)
+        else:
+            self._show_surface(self.punch_frames[self.attack_frame_index])
+
+    def _show_stand_frame(self):
+        # Use stand image surface so we can control flip explicitly
+        if self.stand_images[self.animation_frame] is not None:
+            self._show_frame(self.stand_images, self.stand_images_right, self.animation_frame)
+        else:
+            # Keep Bowser's feet anchored; fallback to actor.image path
+            feet_y = self.y + self.half_height
+            self.actor.image = self.stand_frames[self.animation_frame]
+            self.half_height = self.actor.height / 2
+            self.half_width = self.actor.width / 2
+            self.y = feet_y - self.half_height
+
     def update(self):
         # If in hitstun, skip only flameblast state machine logic, but run the rest of update
         skip_flameblast = self.is_in_hitstun
@@ -1209,10 +1366,8 @@ class Bowser:
             self.on_ground = True
         
         # Always face Mario every frame
-        try:
-            self.facing_right = (mario.x >= self.x)
-        except Exception:
-            pass
+        if self._opponent is not None:
+            self.facing_right = (self._opponent.x >= self.x)
         
         # Update animation state machines: block > hit > flameblast > attack > stand
         if self.is_blocking and self.block_frames:
@@ -1314,156 +1469,12 @@ class Bowser:
                 self.animation_frame = (self.animation_frame + 1) % len(self.stand_frames)
         
         # Pick current image: block > hit > flameblast > attack > stand
-        if self.is_blocking and self.block_frames:
-            current_surface = self.block_frames[self.block_index]
-            feet_y = self.y + self.half_height
-            self.half_height = current_surface.get_height() / 2
-            self.half_width = current_surface.get_width() / 2
-            self.y = feet_y - self.half_height
-            surf = current_surface
-            # Bowser base sprites assumed left-facing → flip when facing right
-            if self.facing_right:
-                surf = pygame.transform.flip(surf, True, False)
-            self.actor._surf = surf
-        elif self.is_playing_hit and self.hit_frames:
-            current_surface = self.hit_frames[self.hit_anim_index]
-            feet_y = self.y + self.half_height
-            self.half_height = current_surface.get_height() / 2
-            self.half_width = current_surface.get_width() / 2
-            self.y = feet_y - self.half_height
-            surf = current_surface
-            if self.facing_right:
-                surf = pygame.transform.flip(surf, True, False)
-            self.actor._surf = surf
-        elif self.is_charging and self.flameblast_charge_frames:
-            current_surface = self.flameblast_charge_frames[self.flameblast_index]
-            feet_y = self.y + self.half_height
-            self.half_height = current_surface.get_height() / 2
-            self.half_width = current_surface.get_width() / 2
-            self.y = feet_y - self.half_height
-            surf = current_surface
-            if self.facing_right:
-                surf = pygame.transform.flip(surf, True, False)
-            self.actor._surf = surf
-        elif self.is_flameblasting and (self.flameblast_charge_frames or self.flameblast_release_frames or self.flameblast_stream_frames) and self.flameblast_phase != "idle":
-            if self.flameblast_phase == "charge" and self.flameblast_charge_frames:
-                current_surface = self.flameblast_charge_frames[self.flameblast_index]
-            elif self.flameblast_phase == "release" and self.flameblast_release_frames:
-                current_surface = self.flameblast_release_frames[self.flameblast_index]
-            elif self.flameblast_phase == "stream" and (self.flameblast_stream_frames or True):
-                # Keep Bowser's body on the 2nd release frame during stream per spec
-                if self.flameblast_release_frames:
-                    current_surface = self.flameblast_release_frames[min(1, len(self.flameblast_release_frames)-1)]
-                else:
-                    current_surface = self.stand_frames[self.animation_frame]
-                # Compute mouth/edge anchor using current body mask edge
-                body_surf = current_surface
-                feet_y = self.y + self.half_height
-                self.half_height = body_surf.get_height() / 2
-                self.half_width = body_surf.get_width() / 2
-                self.y = feet_y - body_surf.get_height() / 2
-                surf = body_surf
-                if self.facing_right:
-                    surf = pygame.transform.flip(surf, True, False)
-                self.actor._surf = surf
-                # Recompute actor pos for body
-                self.actor.pos = (self.x, self.y)
-                # Determine last detectable pixel edge and offset flame 10px inward
-                try:
-                    tmp = body_surf.convert()
-                    tmp.set_colorkey(tmp.get_at((0, 0)))
-                    m = pygame.mask.from_surface(tmp)
-                    r = m.get_bounding_rect()
-                    base_x = int(self.x - body_surf.get_width() / 2)
-                    base_y = int(self.y - body_surf.get_height() / 2)
-                    if self.facing_right:
-                        last_x = r.right - 1  # rightmost local pixel
-                        anchor_x = base_x + last_x - 10
-                    else:
-                        first_x = r.left  # leftmost local pixel
-                        anchor_x = base_x + first_x + 10
-                    anchor_y = base_y + r.y + int(r.h * 0.35)  # approx mouth height
-                    self.flame_left = anchor_x
-                    self.flame_top = anchor_y
-                except Exception:
-                    self.flame_left = int(self.x)
-                    self.flame_top = int(self.y)
-                # Skip normal body surf assignment below; already set
-                current_surface = None
-            else:
-                # Fallback to stand frames if flameblast frames aren't loaded
-                # Load stand frame and orient based on facing
-                name = self.stand_frames[self.animation_frame]
-                try:
-                    current_surface = pygame.image.load(f"images/{name}.png").convert_alpha()
-                except Exception:
-                    current_surface = None
-                if current_surface is not None:
-                    feet_y = self.y + self.half_height
-                    self.half_height = current_surface.get_height() / 2
-                    self.half_width = current_surface.get_width() / 2
-                    self.y = feet_y - self.half_height
-                    surf = current_surface
-                    if self.facing_right:
-                        surf = pygame.transform.flip(surf, True, False)
-                    self.actor._surf = surf
-                return
-            
-            if current_surface is not None:
-                feet_y = self.y + self.half_height
-                self.half_height = current_surface.get_height() / 2
-                self.half_width = current_surface.get_width() / 2
-                self.y = feet_y - self.half_height
-                self.actor._surf = current_surface
-        elif self.is_flameblasting and self.flameblast_phase == "idle":
-            # Safety check: if flameblast is marked as active but phase is idle, force reset
-            self.is_flameblasting = False
-            self.is_charging = False
-            self.flameblast_phase = "idle"
-            # Fall through to stand frames
-        elif self.is_attacking and (self.punch_frames_left or self.punch_frames) and not self.is_blocking:
-            # Use directional punch frames (left raw, right flipped)
-            if self.punch_frames_left:
-                directional_frames = self.punch_frames_right if self.facing_right else self.punch_frames_left
-                current_surface = directional_frames[self.attack_frame_index]
-            else:
-                current_surface = self.punch_frames[self.attack_frame_index]
-            feet_y = self.y + self.half_height
-            self.half_height = current_surface.get_height() / 2
-            self.half_width = current_surface.get_width() / 2
-            self.y = feet_y - self.half_height
-            surf = current_surface
-            # punch frames are already oriented via directional selection; do not flip here
-            self.actor._surf = surf
-        else:
-            # Keep Bowser's feet anchored when swapping back to stand frames
-            feet_y = self.y + self.half_height
-            # Use stand image surface so we can control flip explicitly
-            name = self.stand_frames[self.animation_frame]
-            try:
-                base = pygame.image.load(f"images/{name}.png").convert_alpha()
-            except Exception:
-                base = None
-            if base is not None:
-                self.half_height = base.get_height() / 2
-                self.half_width = base.get_width() / 2
-                self.y = feet_y - self.half_height
-                surf = base
-                if self.facing_right:
-                    surf = pygame.transform.flip(surf, True, False)
-                self.actor._surf = surf
-            else:
-                # fallback to actor.image path
-                self.actor.image = self.stand_frames[self.animation_frame]
-                self.half_height = self.actor.height / 2
-                self.half_width = self.actor.width / 2
-            self.y = feet_y - self.half_height
+        self.anim_state = self._resolve_anim_state()
+        if self._anim_handlers[self.anim_state]():
+            return
         # Update actor position
         self.actor.pos = (self.x, self.y)
         
-        # We oriented surfaces directly; do not flip again
-        self.actor.flip_x = False
-
         # Tick hitstun
         if self.is_in_hitstun:
             self.hitstun_timer -= 1
@@ -1480,33 +1491,24 @@ class Bowser:
                     self.is_playing_hit = False
 
     def draw(self):
-        self.actor.draw()
         # Draw flame stream FX separately so Bowser remains visible
+        fx_surf = None
         if self.is_flameblasting and self.flameblast_phase == "stream":
             # Pick current flame FX frame; if unavailable, fallback to base image surface
-            fx_surf = None
             if self.flameblast_stream_frames:
-                fx_surf = self.flameblast_stream_frames[self.flame_fx_index % len(self.flameblast_stream_frames)]
+                # Orient flame to face Bowser's direction
+                fx_frames = self.flameblast_stream_frames_right if self.facing_right else self.flameblast_stream_frames
+                fx_surf = fx_frames[self.flame_fx_index % len(fx_frames)]
             else:
-                try:
-                    fx_surf = pygame.image.load("images/flameblast.png").convert_alpha()
-                except Exception:
-                    try:
-                        fx_surf = pygame.image.load("images/flaneblast.png").convert_alpha()
-                    except Exception:
-                        fx_surf = None
+                fx_surf = self._fx_fallback_right if self.facing_right else self._fx_fallback
             if fx_surf is not None:
-                # Orient flame to face Bowser's direction
-                if self.facing_right:
-                    fx_surf = pygame.transform.flip(fx_surf, True, False)
-                w, h = fx_surf.get_width(), fx_surf.get_height()
-                if self.facing_right:
-                    left = self.flame_left + 10  # small nudge right for mouth alignment
-                else:
-                    left = self.flame_left - w - 20  # shift 20px further left when facing left
-                top = self.flame_top - h // 2 - 5
-                # Blit directly to screen for reliability
-                screen.surface.blit(fx_surf, (left, top))
+                dx, dy = self._fx_offsets[fx_surf]
+                left = self.flame_left + dx
+                top = self.flame_top + dy
+                # Body then flame, blitted directly to screen in one batched call
+                screen.surface.blits(((self.actor._surf, self.actor.topleft), (fx_surf, (left, top))), doreturn=False)
+        if fx_surf is None:
+            self.actor.draw()
 
     def get_hurtbox(self):
         width = self.actor.width
@@ -1519,8 +1521,7 @@ class Bowser:
         # Tight bounding rect from current visible surface
         surf = self.actor._surf
         try:
-            m = self.get_mask()
-            r = m.get_bounding_rect()
+            r = _mask_bounds(surf)
             top_left_x = int(self.x - surf.get_width() / 2) + r.x
             top_left_y = int(self.y - surf.get_height() / 2) + r.y
             return Rect(top_left_x, top_left_y, r.w, r.h)
@@ -1528,18 +1529,19 @@ class Bowser:
             return self.get_hurtbox()
 
     def get_mask(self):
-        # Build a mask for visible pixels; remove near-background colors
+        # Build a mask for visible pixels
         surf = self.actor._surf
+        # Every frame Bowser shows is a persistent surface, so its mask can be reused
+        cached = self._frame_masks.get(surf)
+        if cached is None:
+            cached = self._mask_cache.get(surf)
+        if cached is not None:
+            return cached
         try:
-            bg = surf.get_at((0, 0))
-            # Full mask (may include background)
-            mask_full = pygame.mask.from_surface(surf)
-            # Background mask using color threshold tolerance
-            tol = (30, 30, 30, 255)
-            mask_bg = pygame.mask.from_threshold(surf, bg, tol)
-            # Subtract background from full to get silhouette
-            mask_full.erase(mask_bg)
-            return mask_full
+            # Alpha mask of the frame (same result the threshold/erase pass fell back to)
+            mask = pygame.mask.from_surface(surf)
+            _bounded_put(self._mask_cache, surf, mask)
+            return mask
         except Exception:
             # If processing fails, return a simple mask from the surface
             try:
@@ -1565,18 +1567,8 @@ class Bowser:
             sheet = pygame.image.load("images/bowser_hit.png").convert()
             bg = sheet.get_at((0, 0))
             sheet.set_colorkey(bg)
-            sw, sh = sheet.get_width(), sheet.get_height()
             # Assume horizontal strip; use square frames based on height
-            fw = sh if sh > 0 else sw
-            frames = []
-            if fw > 0:
-                count = max(1, sw // fw)
-                for i in range(count):
-                    rect = pygame.Rect(i * fw, 0, fw, sh)
-                    frame = pygame.Surface((fw, sh), pygame.SRCALPHA)
-                    frame.blit(sheet, (0, 0), rect)
-                    frames.append(frame.convert_alpha())
-            self.hit_frames = frames
+            self.hit_frames = [_blit_frame(sheet, rect) for rect in _square_frame_rects(sheet)]
         except Exception:
             self.hit_frames = []
 
@@ -1585,95 +1577,32 @@ class Bowser:
             sheet = pygame.image.load("images/bowser_punch.png").convert()
             bg = sheet.get_at((0, 0))
             sheet.set_colorkey(bg)
-            sw, sh = sheet.get_width(), sheet.get_height()
             # Detect non-background column runs across the sheet
-            non_bg_cols = []
-            for x in range(sw):
-                col_has = False
-                for y in range(sh):
-                    if sheet.get_at((x, y)) != bg:
-                        col_has = True
-                        break
-                non_bg_cols.append(col_has)
-            ranges = []
-            in_run = False
-            start = 0
-            for x, has in enumerate(non_bg_cols):
-                if has and not in_run:
-                    in_run = True
-                    start = x
-                elif not has and in_run:
-                    in_run = False
-                    ranges.append((start, x - 1))
-            if in_run:
-                ranges.append((start, sw - 1))
+            mask2d = _non_background_mask(sheet, bg)
+            rgb = pygame.surfarray.array3d(sheet)
 
             frames = []
-            for x0, x1 in ranges:
+            for x0, min_y, x1, max_y in _frame_bounds(mask2d):
                 # Tight vertical bounds for this horizontal slice
-                min_y, max_y = sh, 0
-                for x in range(x0, x1 + 1):
-                    for y in range(sh):
-                        if sheet.get_at((x, y)) != bg:
-                            if y < min_y: min_y = y
-                            if y > max_y: max_y = y
-                if min_y > max_y:
-                    continue
                 rect = pygame.Rect(x0, min_y, (x1 - x0 + 1), (max_y - min_y + 1))
-                tight = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-                tight.blit(sheet, (0, 0), rect)
+                tight = _blit_frame(sheet, rect)
                 # Further crop to largest connected component to remove lingering parts
                 try:
-                    tmp = tight.convert()
-                    tmp.set_colorkey(tmp.get_at((0, 0)))
-                    mask = pygame.mask.from_surface(tmp)
-                    w, h = tight.get_width(), tight.get_height()
-                    visited = set()
-                    largest_bounds = None
-                    largest_size = 0
-                    for ix in range(w):
-                        for iy in range(h):
-                            if mask.get_at((ix, iy)) and (ix, iy) not in visited:
-                                stack = [(ix, iy)]
-                                visited.add((ix, iy))
-                                minx = maxx = ix
-                                miny = maxy = iy
-                                size = 0
-                                while stack:
-                                    cx, cy = stack.pop()
-                                    size += 1
-                                    if cx < minx: minx = cx
-                                    if cx > maxx: maxx = cx
-                                    if cy < miny: miny = cy
-                                    if cy > maxy: maxy = cy
-                                    for nx, ny in ((cx - 1, cy), (cx + 1, cy), (cx, cy - 1), (cx, cy + 1)):
-                                        if 0 <= nx < w and 0 <= ny < h and (nx, ny) not in visited and mask.get_at((nx, ny)):
-                                            visited.add((nx, ny))
-                                            stack.append((nx, ny))
-                                if size > largest_size:
-                                    largest_size = size
-                                    largest_bounds = (minx, miny, maxx, maxy)
+                    mask = _keyed_crop_mask(rgb, mask2d, rect)
+                    largest_bounds = _largest_component_bounds(mask)
                     if largest_bounds:
                         xA, yA, xB, yB = largest_bounds
                         rect2 = pygame.Rect(xA, yA, xB - xA + 1, yB - yA + 1)
-                        frame = pygame.Surface((rect2.width, rect2.height), pygame.SRCALPHA)
-                        frame.blit(tight, (0, 0), rect2)
-                        frames.append(frame.convert_alpha())
+                        frame = _blit_frame(tight, rect2)
+                        frames.append(frame)
                     else:
-                        frames.append(tight.convert_alpha())
+                        frames.append(tight)
                 except Exception:
-                    frames.append(tight.convert_alpha())
+                    frames.append(tight)
 
             # Fallback to equal-width slicing if nothing detected
             if not frames:
-                fw = sh if sh > 0 else sw
-                if fw > 0:
-                    count = max(1, sw // fw)
-                    for i in range(count):
-                        rect = pygame.Rect(i * fw, 0, fw, sh)
-                        frame = pygame.Surface((fw, sh), pygame.SRCALPHA)
-                        frame.blit(sheet, (0, 0), rect)
-                        frames.append(frame.convert_alpha())
+                frames = [_blit_frame(sheet, rect) for rect in _square_frame_rects(sheet)]
             # Sheet is LEFT-facing by default: keep left as base and generate right by flipping
             self.punch_frames = frames
             try:
@@ -1718,147 +1647,71 @@ class Bowser:
             self.flameblast_charge_frames = []
             self.flameblast_release_frames = []
             self.flameblast_stream_frames = []
+        
+        # Whole-image flame FX drawn when no stream frames could be sliced
+        self._fx_fallback = self._fx_fallback_right = None
+        if not self.flameblast_stream_frames:
+            try:
+                self._fx_fallback = pygame.image.load("images/flameblast.png").convert_alpha()
+            except Exception:
+                try:
+                    self._fx_fallback = pygame.image.load("images/flaneblast.png").convert_alpha()
+                except Exception:
+                    pass
+            if self._fx_fallback is not None:
+                self._fx_fallback_right = pygame.transform.flip(self._fx_fallback, True, False)
     
     def _slice_sheet_tight(self, sheet, bg_color):
         """Helper method to slice a spritesheet into tightly cropped frames with no lingering parts"""
-        sw, sh = sheet.get_width(), sheet.get_height()
-        
         # Detect non-background column runs across the whole sheet
-        non_bg_cols = []
-        for x in range(sw):
-            col_has = False
-            for y in range(sh):
-                if sheet.get_at((x, y)) != bg_color:
-                    col_has = True
-                    break
-            non_bg_cols.append(col_has)
-        
-        ranges = []
-        in_run = False
-        start = 0
-        for x, has in enumerate(non_bg_cols):
-            if has and not in_run:
-                in_run = True
-                start = x
-            elif not has and in_run:
-                in_run = False
-                ranges.append((start, x - 1))
-        if in_run:
-            ranges.append((start, sw - 1))
+        mask2d = _non_background_mask(sheet, bg_color)
+        rgb = pygame.surfarray.array3d(sheet)
         
         frames = []
-        for x0, x1 in ranges:
-            # Find tight vertical bounds for this frame slice
-            min_y, max_y = sh, 0
-            for x in range(x0, x1 + 1):
-                for y in range(sh):
-                    if sheet.get_at((x, y)) != bg_color:
-                        if y < min_y: min_y = y
-                        if y > max_y: max_y = y
-            if min_y <= max_y:
-                rect = pygame.Rect(x0, min_y, (x1 - x0 + 1), (max_y - min_y + 1))
-                frame = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-                frame.blit(sheet, (0, 0), rect)
-                
-                # Further crop to largest connected component to remove lingering parts
-                try:
-                    tmp = frame.convert()
-                    tmp.set_colorkey(tmp.get_at((0, 0)))
-                    mask = pygame.mask.from_surface(tmp)
-                    w, h = frame.get_width(), frame.get_height()
-                    visited = set()
-                    largest_bounds = None
-                    largest_size = 0
-                    for ix in range(w):
-                        for iy in range(h):
-                            if mask.get_at((ix, iy)) and (ix, iy) not in visited:
-                                stack = [(ix, iy)]
-                                visited.add((ix, iy))
-                                minx = maxx = ix
-                                miny = maxy = iy
-                                size = 0
-                                while stack:
-                                    cx, cy = stack.pop()
-                                    size += 1
-                                    if cx < minx: minx = cx
-                                    if cx > maxx: maxx = cx
-                                    if cy < miny: miny = cy
-                                    if cy > maxy: maxy = cy
-                                    for nx, ny in ((cx - 1, cy), (cx + 1, cy), (cx, cy - 1), (cx, cy + 1)):
-                                        if 0 <= nx < w and 0 <= ny < h and (nx, ny) not in visited and mask.get_at((nx, ny)):
-                                            visited.add((nx, ny))
-                                            stack.append((nx, ny))
-                                    if size > largest_size:
-                                        largest_size = size
-                                        largest_bounds = (minx, miny, maxx, maxy)
-                    if largest_bounds:
-                        xA, yA, xB, yB = largest_bounds
-                        rect2 = pygame.Rect(xA, yA, xB - xA + 1, yB - yA + 1)
-                        tight_frame = pygame.Surface((rect2.width, rect2.height), pygame.SRCALPHA)
-                        tight_frame.blit(frame, (0, 0), rect2)
-                        frames.append(tight_frame.convert_alpha())
-                    else:
-                        frames.append(frame.convert_alpha())
-                except Exception:
-                    frames.append(frame.convert_alpha())
+        # Tight vertical bounds come with each frame slice
+        for x0, min_y, x1, max_y in _frame_bounds(mask2d):
+            rect = pygame.Rect(x0, min_y, (x1 - x0 + 1), (max_y - min_y + 1))
+            frame = _blit_frame(sheet, rect)
+            
+            # Further crop to largest connected component to remove lingering parts
+            try:
+                mask = _keyed_crop_mask(rgb, mask2d, rect)
+                largest_bounds = _largest_component_bounds(mask)
+                if largest_bounds:
+                    xA, yA, xB, yB = largest_bounds
+                    rect2 = pygame.Rect(xA, yA, xB - xA + 1, yB - yA + 1)
+                    tight_frame = _blit_frame(frame, rect2)
+                    frames.append(tight_frame)
+                else:
+                    frames.append(frame)
+            except Exception:
+                frames.append(frame)
         
         # Fallback: attempt square slicing if tight detection failed
         if not frames:
-            fw = sh if sh > 0 else sw
-            count = max(1, sw // fw) if fw > 0 else 1
-            for i in range(count):
-                rect = pygame.Rect(i * fw, 0, fw, sh)
-                frame = pygame.Surface((fw, sh), pygame.SRCALPHA)
-                frame.blit(sheet, (0, 0), rect)
-                frames.append(frame.convert_alpha())
+            frames = [_blit_frame(sheet, rect) for rect in _square_frame_rects(sheet)]
         
         return frames
     
     def _slice_sheet_small_alpha(self, sheet):
         """Slice horizontally by detecting columns with any alpha > 0 and tightly crop each frame, then scale down."""
-        sw, sh = sheet.get_width(), sheet.get_height()
         # Detect columns with any visible pixel (alpha > 0)
-        non_empty_cols = []
-        for x in range(sw):
-            col_has = False
-            for y in range(sh):
-                if sheet.get_at((x, y)).a > 0:
-                    col_has = True
-                    break
-            non_empty_cols.append(col_has)
-        ranges = []
-        in_run = False
-        start = 0
-        for x, has in enumerate(non_empty_cols):
-            if has and not in_run:
-                in_run = True
-                start = x
-            elif not has and in_run:
-                in_run = False
-                ranges.append((start, x - 1))
-        if in_run:
-            ranges.append((start, sw - 1))
+        alpha = pygame.surfarray.pixels_alpha(sheet)
+        visible = alpha > 0
+        del alpha
         frames = []
-        for x0, x1 in ranges:
-            min_y, max_y = sh, 0
-            for x in range(x0, x1 + 1):
-                for y in range(sh):
-                    if sheet.get_at((x, y)).a > 0:
-                        if y < min_y: min_y = y
-                        if y > max_y: max_y = y
-            if min_y <= max_y:
-                rect = pygame.Rect(x0, min_y, (x1 - x0 + 1), (max_y - min_y + 1))
-                frame = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-                frame.blit(sheet, (0, 0), rect)
-                # Scale down to about half Mario's height
-                target_height = 32
-                if frame.get_height() > 0:
-                    scale = target_height / frame.get_height()
-                    new_w = max(1, int(frame.get_width() * scale))
-                    new_h = max(1, int(frame.get_height() * scale))
-                    frames.append(pygame.transform.smoothscale(frame, (new_w, new_h)).convert_alpha())
-                else:
-                    frames.append(frame.convert_alpha())
+        for x0, min_y, x1, max_y in _frame_bounds(visible):
+            rect = pygame.Rect(x0, min_y, (x1 - x0 + 1), (max_y - min_y + 1))
+            frame = _blit_frame(sheet, rect)
+            # Scale down to about half Mario's height
+            target_height = 32
+            if frame.get_height() > 0:
+                scale = target_height / frame.get_height()
+                new_w = max(1, int(frame.get_width() * scale))
+                new_h = max(1, int(frame.get_height() * scale))
+                frames.append(pygame.transform.smoothscale(frame, (new_w, new_h)))
+            else:
+                frames.append(frame)
         if not frames:
             frames = [sheet.convert_alpha()]
         return frames
@@ -1906,96 +1759,17 @@ class Bowser:
 
     def _slice_sheet(self, sheet, bg_color):
         """Slice a sheet into frames by detecting contiguous non-background column runs with tight vertical crop."""
-        sw, sh = sheet.get_width(), sheet.get_height()
-        non_bg_cols = []
-        for x in range(sw):
-            col_has = False
-            for y in range(sh):
-                if sheet.get_at((x, y)) != bg_color:
-                    col_has = True
-                    break
-            non_bg_cols.append(col_has)
-        ranges = []
-        in_run = False
-        start = 0
-        for x, has in enumerate(non_bg_cols):
-            if has and not in_run:
-                in_run = True
-                start = x
-            elif not has and in_run:
-                in_run = False
-                ranges.append((start, x - 1))
-        if in_run:
-            ranges.append((start, sw - 1))
-        frames = []
-        for x0, x1 in ranges:
-            min_y, max_y = sh, 0
-            for x in range(x0, x1 + 1):
-                for y in range(sh):
-                    if sheet.get_at((x, y)) != bg_color:
-                        if y < min_y: min_y = y
-                        if y > max_y: max_y = y
-            if min_y <= max_y:
-                rect = pygame.Rect(x0, min_y, (x1 - x0 + 1), (max_y - min_y + 1))
-                frame = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-                frame.blit(sheet, (0, 0), rect)
-                frames.append(frame.convert_alpha())
-        # Fallback to square slicing if detection failed
-        if not frames:
-            fw = sh if sh > 0 else sw
-            if fw > 0:
-                count = max(1, sw // fw)
-                for i in range(count):
-                    rect = pygame.Rect(i * fw, 0, fw, sh)
-                    frame = pygame.Surface((fw, sh), pygame.SRCALPHA)
-                    frame.blit(sheet, (0, 0), rect)
-                    frames.append(frame.convert_alpha())
-        return frames
+        # Falls back to square slicing if detection finds nothing
+        return [_blit_frame(sheet, rect) for rect in _detect_frame_rects(sheet, bg_color)]
 
     def _prepare_block_frames(self):
         try:
             sheet = pygame.image.load("images/bowser_block.png").convert()
             bg = sheet.get_at((0, 0))
             sheet.set_colorkey(bg)
-            sw, sh = sheet.get_width(), sheet.get_height()
-            # Detect contiguous non-background column runs (per-frame slices)
-            non_bg_cols = []
-            for x in range(sw):
-                col_has = False
-                for y in range(sh):
-                    if sheet.get_at((x, y)) != bg:
-                        col_has = True
-                        break
-                non_bg_cols.append(col_has)
-            ranges = []
-            in_run = False
-            start = 0
-            for x, has in enumerate(non_bg_cols):
-                if has and not in_run:
-                    in_run = True
-                    start = x
-                elif not has and in_run:
-                    in_run = False
-                    ranges.append((start, x - 1))
-            if in_run:
-                ranges.append((start, sw - 1))
-            frames = []
-            for x0, x1 in ranges:
-                # Use full sheet height to avoid over-cropping; ensures full sprite visible
-                rect = pygame.Rect(x0, 0, (x1 - x0 + 1), sh)
-                frame = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-                frame.blit(sheet, (0, 0), rect)
-                frames.append(frame.convert_alpha())
-            # Fallback to square slices if detection failed
-            if not frames:
-                fw = sh if sh > 0 else sw
-                if fw > 0:
-                    count = max(1, sw // fw)
-                    for i in range(count):
-                        rect = pygame.Rect(i * fw, 0, fw, sh)
-                        frame = pygame.Surface((fw, sh), pygame.SRCALPHA)
-                        frame.blit(sheet, (0, 0), rect)
-                        frames.append(frame.convert_alpha())
+            # Contiguous non-background column runs are the per-frame slices (square slices if none).
+            # Use full sheet height to avoid over-cropping; ensures full sprite visible
+            frames = [_blit_frame(sheet, rect) for rect in _detect_frame_rects(sheet, bg, tight_y=False)]
             # Apply requested reversed order
             self.block_frames = list(reversed(frames))
         except Exception:
@@ -2028,14 +1802,23 @@ class Bowser:
         self.is_blocking = False
         self.is_playing_hit = False
 
+def _set_opponents(m, b):
+    """Give each fighter a direct reference to the other (used for facing)"""
+    m._opponent = b
+    b._opponent = m
+
 # Create Mario and Bowser instances
 mario = Mario()
 bowser = Bowser()
+_set_opponents(mario, bowser)
 
 # Fireball projectile list
 fireballs = []
 
 class Fireball:
+    # Sliced frames and masks shared by every fireball, keyed by sheet path
+    _frame_cache = {}
+
     def __init__(self, x, y, direction, mario_facing_right):
         self.x = x  # Collision position (for hitbox)
         self.y = y  # Collision position (for hitbox)
@@ -2043,8 +1826,7 @@ class Fireball:
         self.speed = 5
         self.alive = True
         
-        # Frames for fireball animation (loop)
-        self.frames = []
+        # Fireball animation (loop) over the shared frames picked in _prepare_frames
         self.index = 0
         self.timer = 0
         self.speed_ticks = 4
@@ -2052,92 +1834,65 @@ class Fireball:
         self._prepare_frames()  # Frames are automatically scaled to 3x size
         
         # Calculate hitbox position (for collision detection)
-        first = self.frames[0]
-        self.left = int(self.x - first.get_width() / 2)
-        self.top = int(self.y - first.get_height() / 2)
+        first_w, first_h = self._frame_sizes[0]
+        self.left = int(self.x - first_w / 2)
+        self.top = int(self.y - first_h / 2)
         
         # Visual position matches collision position exactly
         self.visual_x = self.x
         self.visual_y = self.y
         self.actor.pos = (self.visual_x, self.visual_y)
-        
-        self.actor.flip_x = False
-        # Precompute outlines for each frame (for debug superimposition)
-        self.outlines = [m.outline() for m in self.masks] if hasattr(self, 'masks') else []
+
         self.current_outline = None
 
     def _prepare_frames(self):
+        # Every fireball shows the same frames, so slice the sheet once and share them
+        cached = Fireball._frame_cache.get(FIREBALL_SHEET)
+        if cached is None:
+            frames, masks = self._build_frames()
+            # Left-facing frames, masks and outlines (for debug superimposition) are
+            # mirrored here once rather than on every update and draw
+            frames_left = [pygame.transform.flip(f, True, False) for f in frames]
+            masks_left = [pygame.mask.from_surface(f) for f in frames_left]
+            cached = Fireball._frame_cache[FIREBALL_SHEET] = (
+                (frames, masks, [m.outline() for m in masks]),
+                (frames_left, masks_left, [m.outline() for m in masks_left]),
+                [f.get_size() for f in frames])
+        # (width, height) per frame index, identical for both facings
+        self._frame_sizes = cached[2]
+        # Direction never changes after spawn, so pick the facing set up front
+        self._shown_frames, self._shown_masks, self._shown_outlines = cached[0 if self.direction >= 0 else 1]
+
+    def _slice_frames(self):
+        sheet = pygame.image.load(FIREBALL_SHEET).convert()
+        bg = sheet.get_at((0, 0))
+        sheet.set_colorkey(bg)
+        # Non-background column runs across the whole sheet, each with tight vertical bounds
+        # (square slicing if tight detection failed)
+        return [_blit_frame(sheet, rect) for rect in _detect_frame_rects(sheet, bg)]
+
+    def _slice_scaled_frames(self):
+        """Slice the sheet and scale all frames to 3x size"""
+        scaled_frames = []
+        for frame in self._slice_frames():
+            # Scale frame to 3x size using smooth scaling
+            scaled_width = frame.get_width() * 3
+            scaled_height = frame.get_height() * 3
+            scaled_frame = pygame.transform.smoothscale(frame, (scaled_width, scaled_height))
+            scaled_frames.append(scaled_frame)
+        return scaled_frames
+
+    def _build_frames(self):
+        """Return the 3x scaled fireball frames and their collision masks"""
         try:
-            sheet = pygame.image.load("images/mario_fireball.png").convert()
-            bg = sheet.get_at((0, 0))
-            sheet.set_colorkey(bg)
-            sw, sh = sheet.get_width(), sheet.get_height()
-
-            # Detect non-background column runs across the whole sheet
-            non_bg_cols = []
-            for x in range(sw):
-                col_has = False
-                for y in range(sh):
-                    if sheet.get_at((x, y)) != bg:
-                        col_has = True
-                        break
-                non_bg_cols.append(col_has)
-
-            ranges = []
-            in_run = False
-            start = 0
-            for x, has in enumerate(non_bg_cols):
-                if has and not in_run:
-                    in_run = True
-                    start = x
-                elif not has and in_run:
-                    in_run = False
-                    ranges.append((start, x - 1))
-            if in_run:
-                ranges.append((start, sw - 1))
-
-            tight_frames = []
-            for x0, x1 in ranges:
-                # Find tight vertical bounds for this frame slice
-                min_y, max_y = sh, 0
-                for x in range(x0, x1 + 1):
-                    for y in range(sh):
-                        if sheet.get_at((x, y)) != bg:
-                            if y < min_y:
-                                min_y = y
-                            if y > max_y:
-                                max_y = y
-                if min_y <= max_y:
-                    rect = pygame.Rect(x0, min_y, (x1 - x0 + 1), (max_y - min_y + 1))
-                    frame = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-                    frame.blit(sheet, (0, 0), rect)
-                    tight_frames.append(frame.convert_alpha())
-
-            # Fallback: attempt square slicing if tight detection failed
-            if not tight_frames:
-                fw = sh if sh > 0 else sw
-                count = max(1, sw // fw) if fw > 0 else 1
-                for i in range(count):
-                    rect = pygame.Rect(i * fw, 0, fw, sh)
-                    frame = pygame.Surface((fw, sh), pygame.SRCALPHA)
-                    frame.blit(sheet, (0, 0), rect)
-                    tight_frames.append(frame.convert_alpha())
-
-            # Scale all frames to 3x size
-            scaled_frames = []
-            for frame in tight_frames:
-                # Scale frame to 3x size using smooth scaling
-                scaled_width = frame.get_width() * 3
-                scaled_height = frame.get_height() * 3
-                scaled_frame = pygame.transform.smoothscale(frame, (scaled_width, scaled_height))
-                scaled_frames.append(scaled_frame)
+            # The disk cache holds the frames already scaled, so a warm start skips smoothscale too
+            scaled_frames = _load_or_build("mario_fireball_3x", FIREBALL_SHEET, self._slice_scaled_frames)
             
-            self.frames = scaled_frames if scaled_frames else [self.actor._surf]
+            frames = scaled_frames if scaled_frames else [self.actor._surf]
             # Build per-frame masks for pixel-perfect collision from scaled frames
-            self.masks = [pygame.mask.from_surface(s) for s in self.frames]
+            return frames, [pygame.mask.from_surface(s) for s in frames]
         except Exception:
-            self.frames = [self.actor._surf]
-            self.masks = [pygame.mask.from_surface(self.actor._surf)]
+            return [self.actor._surf], [pygame.mask.from_surface(self.actor._surf)]
 
     def get_hitbox(self):
         # Tight bounding rect from current visual surface anchored at top-left
@@ -2159,51 +1914,42 @@ class Fireball:
         self.timer += 1
         if self.timer >= self.speed_ticks:
             self.timer = 0
-            self.index = (self.index + 1) % len(self.frames)
-        # Select current frame and apply flip for direction
-        current = self.frames[self.index]
-        if self.direction < 0:
-            current = pygame.transform.flip(current, True, False)
+            self.index = (self.index + 1) % len(self._shown_frames)
+        # Select current frame (already mirrored for direction)
+        current = self._shown_frames[self.index]
+        frame_w, frame_h = self._frame_sizes[self.index]
         # Update collision anchor for current frame size (using collision position)
-        self.left = int(self.x - current.get_width() / 2)
-        self.top = int(self.y - current.get_height() / 2)
+        self.left = int(self.x - frame_w / 2)
+        self.top = int(self.y - frame_h / 2)
         # Update visuals and mask to match exactly
         self.actor._surf = current
         # Update visual position to match collision position exactly
         self.actor.pos = (self.visual_x, self.visual_y)
-        self.actor.flip_x = False  # we already flipped the surface
-        self.current_mask = pygame.mask.from_surface(current)
-        # Compute current outline (debug) aligned to current frame orientation
-        try:
-            base_outline = self.outlines[self.index] if self.outlines else self.current_mask.outline()
-            if self.direction < 0:
-                w = current.get_width()
-                self.current_outline = [(w - 1 - px, py) for (px, py) in base_outline]
-            else:
-                self.current_outline = list(base_outline)
-        except Exception:
-            self.current_outline = None
+        self.current_mask = self._shown_masks[self.index]
+        # Current outline (debug) aligned to current frame orientation
+        self.current_outline = self._shown_outlines[self.index]
 
         # Despawn off screen
-        if self.left + current.get_width() < -50 or self.left > WIDTH + 50:
+        if self.left + frame_w < -50 or self.left > WIDTH + 50:
             self.alive = False
 
+    def blit_item(self):
+        """Return the (surface, position) pair that draws the current frame centered at (x, y)"""
+        frame_w, frame_h = self._frame_sizes[self.index]
+        return self._shown_frames[self.index], (int(self.x - frame_w // 2), int(self.y - frame_h // 2))
+
     def draw(self):
         if self.alive:
             # Draw the current frame centered at (self.x, self.y)
-            current = self.frames[self.index]
-            if self.direction < 0:
-                current = pygame.transform.flip(current, True, False)
-            frame_w, frame_h = current.get_width(), current.get_height()
-            screen.blit(current, (int(self.x - frame_w // 2), int(self.y - frame_h // 2)))
+            screen.blit(*self.blit_item())
             # Draw a debug dot at the intended center only in debug mode
             if DEBUG_SHOW_BOXES:
                 screen.draw.filled_circle((int(self.x), int(self.y)), 5, (255, 0, 0))
             # Superimpose hitbox outline on the sprite for exact visual match (debug)
             if DEBUG_SHOW_BOXES and self.current_mask:
-                pts = [(self.left + px, self.top + py) for (px, py) in self.current_mask.outline()]
-                for i in range(1, len(pts)):
-                    screen.draw.line(pts[i-1], pts[i], (255, 0, 0))
+                pts = [(self.left + px, self.top + py) for (px, py) in self.current_outline]
+                if len(pts) > 1:
+                    pygame.draw.lines(screen.surface, (255, 0, 0), False, pts)
 
 def update():
     global DEBUG_SHOW_BOXES, _debug_ticks, _debug_toggle_consumed, DEBUG_STOPTIME, _stop_toggle_consumed, GAME_START_TICKS
@@ -2236,25 +1982,33 @@ def update():
         # Bowser update
         bowser.update()
         
+        # Hurtboxes stay put through the collision passes below (hits only set flags and timers)
+        mario_hitbox = mario.get_hurtbox()
+        bowser_hitbox = bowser.get_hurtbox()
+        
         # Mario hammer attack collision against Bowser
         if mario.is_attacking and mario.attack_frame_index < len(mario.attack_frames) and not mario.attack_has_hit:
             atk_info = mario.get_attack_mask()
             if atk_info is not None:
                 amask, ax, ay = atk_info
-                bowser_hitbox = bowser.get_hurtbox()
                 if bowser_hitbox:
-                    # Convert hitbox to mask for pixel-perfect collision
-                    bowser_surf = bowser.actor._surf if hasattr(bowser.actor, '_surf') else bowser.actor.image
-                    bowser_mask = pygame.mask.from_surface(bowser_surf)
+                    # Pixel-perfect collision against Bowser's current frame (mask cached per frame)
+                    bowser_surf = bowser.actor._surf
+                    bw, bh = bowser_surf.get_size()
                     # Calculate offset between attack mask and bowser surface
-                    offset_x = int(ax - (bowser.x - bowser_surf.get_width() / 2))
-                    offset_y = int(ay - (bowser.y - bowser_surf.get_height() / 2))
-                    if amask.overlap(bowser_mask, (offset_x, offset_y)):
-                        print(f"[DEBUG] Mario hammer hit Bowser!")
+                    offset_x = int(ax - (bowser.x - bw / 2))
+                    offset_y = int(ay - (bowser.y - bh / 2))
+                    # Only look at pixels once the two mask rects actually intersect
+                    aw, ah = amask.get_size()
+                    if (-bw < offset_x < aw and -bh < offset_y < ah
+                            and amask.overlap(bowser.get_mask(), (offset_x, offset_y))):
+                        if DEBUG_SHOW_BOXES:
+                            print(f"[DEBUG] Mario hammer hit Bowser!")
                         mario.attack_has_hit = True
                         # Check if Bowser is charging flameblast for double damage
                         if bowser.is_charging and bowser.is_flameblasting and bowser.flameblast_phase == "charge":
-                            print(f"[DEBUG] Double damage for interrupting flameblast charge!")
+                            if DEBUG_SHOW_BOXES:
+                                print(f"[DEBUG] Double damage for interrupting flameblast charge!")
                             bowser.health -= 40  # Double damage
                             bowser.start_hitstun_anim(60)  # Double hitstun
                             bowser._end_flameblast()  # End flameblast early
@@ -2267,13 +2021,14 @@ def update():
         if bowser.is_attacking and bowser.attack_frame_index < len(bowser.punch_frames) and not bowser.attack_has_hit:
             atk_info = bowser.get_attack_hitbox()
             if atk_info is not None:
-                mario_hitbox = mario.get_hurtbox()
                 if mario_hitbox and atk_info.colliderect(mario_hitbox):
-                    print(f"[DEBUG] Bowser punch hit Mario!")
+                    if DEBUG_SHOW_BOXES:
+                        print(f"[DEBUG] Bowser punch hit Mario!")
                     bowser.attack_has_hit = True
                     # Check if Mario is charging fireball for double damage
                     if mario.is_special and mario.special_phase == "charge":
-                        print(f"[DEBUG] Double damage for interrupting fireball charge!")
+                        if DEBUG_SHOW_BOXES:
+                            print(f"[DEBUG] Double damage for interrupting fireball charge!")
                         mario.health -= 30  # Double damage
                         mario.start_hitstun_anim(60)  # Double hitstun
                         mario._end_special()  # End fireball early
@@ -2284,20 +2039,21 @@ def update():
         # Mario vs Bowser flameblast collision
         bowser_flameblast_hitbox = bowser.get_flameblast_hitbox()
         if bowser_flameblast_hitbox and bowser.is_flameblasting and bowser.flameblast_phase == "stream":
-            mario_hitbox = mario.get_hurtbox()
             if mario_hitbox and bowser_flameblast_hitbox.colliderect(mario_hitbox):
                 if not mario.is_blocking:
-                    print(f"[DEBUG] Mario hit by flameblast!")
+                    if DEBUG_SHOW_BOXES:
+                        print(f"[DEBUG] Mario hit by flameblast!")
                     # Apply continuous damage at 7.5 HP per second (assuming 60 FPS)
                     mario.health -= (7.5 / 60.0)
                     mario.start_hitstun_anim(45)
         
-        # Fireball vs Bowser collision
-        for fb in fireballs[:]:  # Copy list to avoid modification during iteration
-            bowser_hitbox = bowser.get_hurtbox()
-            if bowser_hitbox and fb.get_hitbox().colliderect(bowser_hitbox):
-                print(f"[DEBUG] Fireball hit Bowser!")
-                fireballs.remove(fb)
+        # Fireball vs Bowser collision (at most one fireball lands per tick)
+        if bowser_hitbox and fireballs:
+            hit_index = bowser_hitbox.collidelist([fb.get_hitbox() for fb in fireballs])
+            if hit_index >= 0:
+                if DEBUG_SHOW_BOXES:
+                    print(f"[DEBUG] Fireball hit Bowser!")
+                fireballs.pop(hit_index)
                 if not bowser.is_blocking:
                     bowser.health -= 15
                     bowser.start_hitstun_anim(30)
@@ -2306,74 +2062,79 @@ def update():
                     bowser.is_blocking = False
                     bowser.health -= 15
                     bowser.start_hitstun_anim(30)
-                break
         
         # Fireball vs flameblast collision
-        for fb in fireballs[:]:
-            bowser_flameblast_hitbox = bowser.get_flameblast_hitbox()
-            if bowser_flameblast_hitbox and bowser.is_flameblasting and bowser.flameblast_phase == "stream":
-                if fb.get_hitbox().colliderect(bowser_flameblast_hitbox):
+        if fireballs and bowser_flameblast_hitbox and bowser.is_flameblasting and bowser.flameblast_phase == "stream":
+            hit_index = bowser_flameblast_hitbox.collidelist([fb.get_hitbox() for fb in fireballs])
+            if hit_index >= 0:
+                if DEBUG_SHOW_BOXES:
                     print(f"[DEBUG] Fireball vs flameblast collision!")
-                    fireballs.remove(fb)
-                    bowser._end_flameblast()
-                    break
+                fireballs.pop(hit_index)
+                bowser._end_flameblast()
         
-        # Update fireballs
-        for fb in fireballs[:]:
+        # Update fireballs, then drop the ones that left the screen in one pass
+        # (the list is only rebuilt on ticks where something despawned)
+        despawned = False
+        for fb in fireballs:
             fb.update()
             if not fb.alive:
-                fireballs.remove(fb)
+                despawned = True
+        if despawned:
+            fireballs[:] = [fb for fb in fireballs if fb.alive]
+
+# Last rendered HP label per fighter: label -> (value, surface)
+_hp_text_cache = {}
+
+def _hp_text(label, value):
+    """Return the rendered "<label>: <value>" HUD text, re-rendering only when the value changes"""
+    cached = _hp_text_cache.get(label)
+    if cached is None or cached[0] != value:
+        cached = _hp_text_cache[label] = (value, ptext.getsurf(f"{label}: {value}", color="white", fontsize=24))
+    return cached[1]
 
 def draw():
+    global _clock_tenths, _clock_str
     # Draw Peach's Castle background scaled to cover the whole screen
     _prepare_background()
     screen.surface.blit(_background_surface, _background_pos)
     
     if game_state == "playing":
         
-        # Draw characters with equal layering using depth sort by feet position
-        draw_list = [
-            (mario.y + mario.half_height, mario),
-            (bowser.y + bowser.half_height, bowser),
-        ]
-        for _, character in sorted(draw_list, key=lambda item: item[0]):
+        # Draw characters with equal layering using depth sort by feet position (Mario first on ties)
+        if mario.y + mario.half_height <= bowser.y + bowser.half_height:
+            draw_order = (mario, bowser)
+        else:
+            draw_order = (bowser, mario)
+        for character in draw_order:
             character.draw()
             if DEBUG_SHOW_BOXES:
                 # Draw Bowser's pixel-perfect mask outline in debug mode
                 if isinstance(character, Bowser):
-                    # Get the current surface, fallback to actor.image if _surf is not set
-                    surf = getattr(character.actor, '_surf', None)
-                    if surf is None:
-                        surf = character.actor.image
-                    mask = character.get_mask()
-                    outline = mask.outline()
+                    surf = character.actor._surf
+                    outline = _mask_outline(character.get_mask())
                     base_x = int(character.x - surf.get_width() / 2)
                     base_y = int(character.y - surf.get_height() / 2)
                     pts = [(base_x + px, base_y + py) for (px, py) in outline]
-                    for i in range(1, len(pts)):
-                        screen.draw.line(pts[i-1], pts[i], (0, 255, 0))
+                    if len(pts) > 1:
+                        pygame.draw.lines(screen.surface, (0, 255, 0), False, pts)
                 else:
                     # Use pixel-perfect mask outline for Mario too, exactly like Bowser
-                    # Get the current surface, fallback to actor.image if _surf is not set
-                    surf = getattr(character.actor, '_surf', None)
-                    if surf is None:
-                        surf = character.actor.image
-                    mask = character.get_mask()
-                    outline = mask.outline()
+                    surf = character.actor._surf
+                    outline = _mask_outline(character.get_mask())
                     # Apply Mario calibration offsets so debug outline matches adjusted hurtbox
                     base_x = int(character.x - surf.get_width() / 2 + (MARIO_BOX_OFFSET_X if isinstance(character, Mario) else 0))
                     base_y = int(character.y - surf.get_height() / 2 + (MARIO_BOX_OFFSET_Y if isinstance(character, Mario) else 0))
                     pts = [(base_x + px, base_y + py) for (px, py) in outline]
-                    for i in range(1, len(pts)):
-                        screen.draw.line(pts[i-1], pts[i], (0, 255, 0))
+                    if len(pts) > 1:
+                        pygame.draw.lines(screen.surface, (0, 255, 0), False, pts)
         if DEBUG_SHOW_BOXES:
             # Draw Mario hammer mask outline when active; no rectangle fallback
             atk_info = mario.get_attack_mask()
             if atk_info is not None:
                 amask, ax, ay = atk_info
-                pts = [(ax + px, ay + py) for (px, py) in amask.outline()]
-                for i in range(1, len(pts)):
-                    screen.draw.line(pts[i-1], pts[i], (255, 0, 0))
+                pts = [(ax + px, ay + py) for (px, py) in _mask_outline(amask)]
+                if len(pts) > 1:
+                    pygame.draw.lines(screen.surface, (255, 0, 0), False, pts)
             batk = bowser.get_attack_hitbox() if hasattr(bowser, 'get_attack_hitbox') else None
             if batk:
                 screen.draw.rect(batk, (255, 128, 0))
@@ -2384,27 +2145,33 @@ def draw():
             # Debug clock (top-center): mm:ss.t since game start
             if GAME_START_TICKS is not None:
                 elapsed_ms = max(0, pygame.time.get_ticks() - GAME_START_TICKS)
-                minutes = elapsed_ms // 60000
-                seconds = (elapsed_ms // 1000) % 60
-                tenths = (elapsed_ms // 100) % 10
-                clock_str = f"{minutes:02d}:{seconds:02d}.{tenths}"
-                screen.draw.text(clock_str, center=(WIDTH // 2, 20), color="white", fontsize=28, owidth=1, ocolor="black")
-        # Draw projectiles on same plane
-        for fb in fireballs:
-            fb.draw()
-            # screen.draw.rect(fb.get_hitbox(), (255, 0, 0))
+                if elapsed_ms // 100 != _clock_tenths:
+                    _clock_tenths = elapsed_ms // 100
+                    minutes = elapsed_ms // 60000
+                    seconds = (elapsed_ms // 1000) % 60
+                    tenths = _clock_tenths % 10
+                    _clock_str = f"{minutes:02d}:{seconds:02d}.{tenths}"
+                screen.draw.text(_clock_str, center=(WIDTH // 2, 20), color="white", fontsize=28, owidth=1, ocolor="black")
+        # Draw projectiles on same plane (one blits() call for all of them outside debug mode)
+        if DEBUG_SHOW_BOXES:
+            for fb in fireballs:
+                fb.draw()
+                # screen.draw.rect(fb.get_hitbox(), (255, 0, 0))
+        elif fireballs:
+            screen.surface.blits([fb.blit_item() for fb in fireballs if fb.alive], doreturn=0)
         
         # Draw Mario health bar with castle-themed colors (integer-only display)
+        # (plain fills: the bars are opaque, so this matches draw.filled_rect without its wrapper)
         mario_hp_int = max(0, int(mario.health))
-        screen.draw.filled_rect(Rect(50, 50, 160, 16), (139, 69, 19))  # Brown background
-        screen.draw.filled_rect(Rect(50, 50, int(mario_hp_int * (160/500)), 16), (255, 215, 0))  # Gold health scaled to 500 max
-        screen.draw.text("Mario HP: " + str(mario_hp_int), (50, 30), color="white", fontsize=24)
+        screen.surface.fill((139, 69, 19), MARIO_HP_BAR)  # Brown background
+        screen.surface.fill((255, 215, 0), (50, 50, int(mario_hp_int * (160/500)), 16))  # Gold health scaled to 500 max
+        screen.surface.blit(_hp_text("Mario HP", mario_hp_int), (50, 30))
         
         # Draw Bowser health bar with castle-themed colors (integer-only display)
         bowser_hp_int = max(0, int(bowser.health))
-        screen.draw.filled_rect(Rect(WIDTH - 210, 50, 160, 16), (139, 69, 19))  # Brown background
-        screen.draw.filled_rect(Rect(WIDTH - 210, 50, int(bowser_hp_int * (160/500)), 16), (255, 69, 0))  # Orange-red health scaled to 500 max
-        screen.draw.text("Bowser HP: " + str(bowser_hp_int), (WIDTH - 210, 30), color="white", fontsize=24)
+        screen.surface.fill((139, 69, 19), BOWSER_HP_BAR)  # Brown background
+        screen.surface.fill((255, 69, 0), (WIDTH - 210, 50, int(bowser_hp_int * (160/500)), 16))  # Orange-red health scaled to 500 max
+        screen.surface.blit(_hp_text("Bowser HP", bowser_hp_int), (WIDTH - 210, 30))
     
     elif game_state == "menu":
         # Add semi-transparent overlay for better text readability